@@ -26,15 +26,30 @@ Usage:
 __version__ = "1.0.0"
 __author__ = "TRCC Linux Contributors"
 
-# Core exports
-from trcc.dc_config import DcConfig
-from trcc.dc_parser import dc_to_overlay_config, parse_dc_file
-from trcc.device_detector import detect_devices, get_device_path
-from trcc.device_lcd import LCDDriver
-
-# Animation
-from trcc.media_player import VideoDecoder
-from trcc.system_info import format_metric, get_all_metrics
+# Re-exports resolve lazily (PEP 562) so `import trcc.device_lcd` and
+# friends don't drag in PIL/numpy/ffmpeg machinery they never touch.
+_EXPORTS = {
+    "DcConfig": ("trcc.dc_config", "DcConfig"),
+    "dc_to_overlay_config": ("trcc.dc_parser", "dc_to_overlay_config"),
+    "parse_dc_file": ("trcc.dc_parser", "parse_dc_file"),
+    "detect_devices": ("trcc.device_detector", "detect_devices"),
+    "get_device_path": ("trcc.device_detector", "get_device_path"),
+    "LCDDriver": ("trcc.device_lcd", "LCDDriver"),
+    "VideoDecoder": ("trcc.media_player", "VideoDecoder"),
+    "format_metric": ("trcc.system_info", "format_metric"),
+    "get_all_metrics": ("trcc.system_info", "get_all_metrics"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module 'trcc' has no attribute {name!r}") from None
+    import importlib
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value  # cache for subsequent lookups
+    return value
 
 __all__ = [
     # Version
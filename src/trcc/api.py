@@ -183,11 +183,11 @@ async def send_image(device_id: int, image: UploadFile, rotation: int = 0,
 @app.get("/themes")
 def list_themes(resolution: str = "320x320") -> list[ThemeResponse]:
     """List available local themes for a given resolution."""
-    try:
-        parts = resolution.split("x")
-        w, h = int(parts[0]), int(parts[1])
-    except (ValueError, IndexError):
+    from trcc.theme_downloader import parse_resolution
+    parsed = parse_resolution(resolution)
+    if parsed is None:
         raise HTTPException(status_code=400, detail="Invalid resolution format (use WxH)")
+    w, h = parsed
     if not (100 <= w <= 4096 and 100 <= h <= 4096):
         raise HTTPException(status_code=400, detail="Resolution out of range (100-4096)")
 
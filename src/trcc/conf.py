@@ -24,9 +24,11 @@ Usage:
 """
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -36,8 +38,29 @@ from .data_repository import (
     ThemeDir,
 )
 
+# Optional: C JSON codec for config persistence (falls back to stdlib)
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 log = logging.getLogger(__name__)
 
+
+def _json_dumps(obj: dict) -> bytes:
+    """Serialize config to indent=2 JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _json_loads(data: bytes) -> dict:
+    """Parse JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # =========================================================================
 # Config file location (XDG-compliant)
 # =========================================================================
@@ -59,20 +82,66 @@ SUPPORTED_RESOLUTIONS = [
 # Low-level config persistence
 # =========================================================================
 
+# In-process config cache, invalidated by mtime: repeated reads (UI
+# polling hits load_config per event) cost one os.stat instead of a
+# disk read + JSON parse. Keyed on path so tests patching CONFIG_PATH
+# stay isolated.
+_CFG_CACHE: dict = {'path': None, 'mtime': -1, 'data': None}
+
+
 def load_config() -> dict:
-    """Load user config from disk. Returns empty dict on missing/corrupt file."""
+    """Load user config from disk. Returns empty dict on missing/corrupt file.
+
+    Cached per (path, mtime); callers receive a fresh copy and may
+    mutate it freely.
+    """
+    import copy
+
+    try:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        return {}
+    if (_CFG_CACHE['path'] == CONFIG_PATH
+            and _CFG_CACHE['mtime'] == st.st_mtime_ns):
+        return copy.deepcopy(_CFG_CACHE['data'])
+    # Targeted catches only (no bare Exception): ValueError covers both
+    # codecs' decode errors (json.JSONDecodeError subclasses it), OSError
+    # covers unreadable files; anything else is a real bug and bubbles up.
     try:
-        with open(CONFIG_PATH, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        with open(CONFIG_PATH, 'rb') as f:
+            data = _json_loads(f.read())
+    except (ValueError, OSError):
         return {}
+    _CFG_CACHE.update(path=CONFIG_PATH, mtime=st.st_mtime_ns, data=data)
+    return copy.deepcopy(data)
 
 
 def save_config(config: dict):
-    """Save user config to disk."""
+    """Save user config to disk (atomic; skipped when content is unchanged)."""
+    # Coalesce redundant writes: UI events often re-save an identical
+    # config. Only skip when the file on disk still matches the cache —
+    # another process (GUI vs CLI) may have rewritten it since.
+    if _CFG_CACHE['path'] == CONFIG_PATH and _CFG_CACHE['data'] == config:
+        try:
+            if os.stat(CONFIG_PATH).st_mtime_ns == _CFG_CACHE['mtime']:
+                return
+        except OSError:
+            pass  # File gone — fall through and write it
+    data = _json_dumps(config)
     os.makedirs(CONFIG_DIR, exist_ok=True)
-    with open(CONFIG_PATH, 'w') as f:
-        json.dump(config, f, indent=2)
+    # Write-then-rename so a crash mid-write can't truncate the config
+    tmp_path = CONFIG_PATH + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, CONFIG_PATH)
+    import copy
+
+    try:
+        _CFG_CACHE.update(path=CONFIG_PATH,
+                          mtime=os.stat(CONFIG_PATH).st_mtime_ns,
+                          data=copy.deepcopy(config))
+    except OSError:
+        _CFG_CACHE.update(path=None, mtime=-1, data=None)
 
 
 # =========================================================================
@@ -131,9 +200,14 @@ class Settings:
         save_config(config)
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def device_config_key(index: int, vid: int, pid: int) -> str:
-        """Build per-device config key, e.g. '0:87cd_70db'."""
-        return f"{index}:{vid:04x}_{pid:04x}"
+        """Build per-device config key, e.g. '0:87cd_70db'.
+
+        Cached and interned: the same few devices are keyed on every UI
+        tick, so repeated dict lookups become pointer compares.
+        """
+        return sys.intern(f"{index}:{vid:04x}_{pid:04x}")
 
     @staticmethod
     def get_device_config(key: str) -> dict:
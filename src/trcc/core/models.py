@@ -88,7 +88,9 @@ class ThemeInfo:
     animation_path: Optional[Path] = None       # Theme.zt or video file
     config_path: Optional[Path] = None          # config1.dc
 
-    # Metadata
+    # Metadata. is_animated/is_mask_only are plain fields computed once at
+    # construction — reading them during thumbnail paint is a single
+    # attribute load, no property/derivation cost.
     resolution: Tuple[int, int] = (320, 320)
     is_animated: bool = False
     is_mask_only: bool = False
@@ -100,34 +102,44 @@ class ThemeInfo:
 
     @classmethod
     def from_directory(cls, path: Path, resolution: Tuple[int, int] = (320, 320)) -> 'ThemeInfo':
-        """Create ThemeInfo from a theme directory."""
+        """Create ThemeInfo from a theme directory.
+
+        Classifies every file from a single directory listing instead of
+        stat-probing each well-known name.
+        """
+        import os
+
         td = ThemeDir(path)
+        try:
+            with os.scandir(path) as it:
+                names = {e.name for e in it}
+        except OSError:
+            names = set()
+
+        has_bg = td.bg.name in names
+        has_mask = td.mask.name in names
 
         # Determine if animated — check Theme.zt first, then .mp4 files
-        if td.zt.exists():
+        if td.zt.name in names:
             is_animated = True
             animation_path = td.zt
         else:
-            mp4_files = list(path.glob('*.mp4'))
-            if mp4_files:
-                is_animated = True
-                animation_path = mp4_files[0]
-            else:
-                is_animated = False
-                animation_path = None
+            mp4_name = next((n for n in sorted(names) if n.endswith('.mp4')), None)
+            is_animated = mp4_name is not None
+            animation_path = path / mp4_name if mp4_name else None
 
         return cls(
             name=path.name,
             path=path,
             theme_type=ThemeType.LOCAL,
-            background_path=td.bg if td.bg.exists() else None,
-            mask_path=td.mask if td.mask.exists() else None,
-            thumbnail_path=td.preview if td.preview.exists() else (td.bg if td.bg.exists() else None),
+            background_path=td.bg if has_bg else None,
+            mask_path=td.mask if has_mask else None,
+            thumbnail_path=td.preview if td.preview.name in names else (td.bg if has_bg else None),
             animation_path=animation_path,
-            config_path=td.dc if td.dc.exists() else None,
+            config_path=td.dc if td.dc.name in names else None,
             resolution=resolution,
             is_animated=is_animated,
-            is_mask_only=not td.bg.exists() and td.mask.exists(),
+            is_mask_only=not has_bg and has_mask,
         )
 
     @classmethod
@@ -177,8 +189,17 @@ class DeviceInfo:
 
     @property
     def resolution_str(self) -> str:
-        """Get resolution as string (e.g., '320x320')."""
-        return f"{self.resolution[0]}x{self.resolution[1]}"
+        """Get resolution as string (e.g., '320x320').
+
+        Cached against the current resolution tuple — device rows repaint
+        this every frame; recomputes transparently if resolution changes.
+        """
+        res = self.resolution
+        cached = getattr(self, '_res_str_cache', None)
+        if cached is None or cached[0] != res:
+            cached = (res, f"{res[0]}x{res[1]}")
+            self._res_str_cache = cached
+        return cached[1]
 
 
 @dataclass
@@ -228,7 +249,13 @@ class LCDDeviceConfig:
 
     @staticmethod
     def from_key(impl_key: str) -> 'LCDDeviceConfig':
-        """Factory: create config from implementation key."""
+        """Factory: create config from implementation key.
+
+        Always returns a fresh instance: width/height/fbl/
+        resolution_detected are mutated per device by resolution
+        detection, so instances must not be cached or shared
+        across drivers.
+        """
         name = IMPL_NAMES.get(impl_key, "Generic LCD")
         return LCDDeviceConfig(name=name)
 
@@ -245,6 +272,14 @@ class PlaybackState(Enum):
     PAUSED = auto()
 
 
+def _fmt_mmss(frames: int, fps: float) -> str:
+    """Format a frame count as MM:SS (integer arithmetic after one divide)."""
+    if fps <= 0:
+        return "00:00"
+    secs = int(frames / fps)
+    return f"{secs // 60:02d}:{secs % 60:02d}"
+
+
 @dataclass
 class VideoState:
     """
@@ -266,18 +301,21 @@ class VideoState:
     @property
     def current_time_str(self) -> str:
         """Get current time as MM:SS string."""
-        if self.fps <= 0:
-            return "00:00"
-        secs = self.current_frame / self.fps
-        return f"{int(secs // 60):02d}:{int(secs % 60):02d}"
+        return _fmt_mmss(self.current_frame, self.fps)
 
     @property
     def total_time_str(self) -> str:
-        """Get total time as MM:SS string."""
-        if self.fps <= 0:
-            return "00:00"
-        secs = self.total_frames / self.fps
-        return f"{int(secs // 60):02d}:{int(secs % 60):02d}"
+        """Get total time as MM:SS string.
+
+        Cached against (total_frames, fps) — this label is re-read every
+        progress tick but only changes when a new file loads.
+        """
+        key = (self.total_frames, self.fps)
+        cached = getattr(self, '_total_str_cache', None)
+        if cached is None or cached[0] != key:
+            cached = (key, _fmt_mmss(self.total_frames, self.fps))
+            self._total_str_cache = cached
+        return cached[1]
 
     @property
     def frame_interval_ms(self) -> int:
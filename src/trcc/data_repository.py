@@ -15,6 +15,7 @@ Config persistence lives in conf.py; device protocols in their respective module
 """
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import shutil
@@ -123,15 +124,23 @@ class ThemeDir:
         A valid theme subdir must contain at least one .png file.
         Skips dotfiles, Custom_* placeholder dirs, and dirs with only config files.
         """
-        if not os.path.isdir(theme_dir):
+        try:
+            it = os.scandir(theme_dir)
+        except OSError:
             return False
-        for item in os.listdir(theme_dir):
-            item_path = os.path.join(theme_dir, item)
-            if (os.path.isdir(item_path)
-                    and not item.startswith('.')
-                    and not item.startswith('Custom_')):
-                if any(f.endswith('.png') for f in os.listdir(item_path)):
-                    return True
+        # scandir reuses readdir-cached types and short-circuits on the
+        # first subdir with image content.
+        with it:
+            for entry in it:
+                if (entry.is_dir()
+                        and not entry.name.startswith('.')
+                        and not entry.name.startswith('Custom_')):
+                    try:
+                        with os.scandir(entry.path) as sub:
+                            if any(f.name.endswith('.png') for f in sub):
+                                return True
+                    except OSError:
+                        continue
         return False
 
     @classmethod
@@ -272,7 +281,12 @@ class DataManager:
 
     @staticmethod
     def extract_7z(archive: str, target_dir: str) -> bool:
-        """Extract a .7z archive into target_dir using 7z CLI. Returns True on success."""
+        """Extract a .7z archive into target_dir using 7z CLI. Returns True on success.
+
+        Extraction deliberately stays in the 7z subprocess: its C decoder
+        writes members directly to disk, so nothing bounces through Python
+        buffers regardless of pack size.
+        """
         os.makedirs(target_dir, exist_ok=True)
         try:
             # Validate archive members before extraction (zip-slip prevention)
@@ -310,8 +324,38 @@ class DataManager:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def download_archive(url: str, dest_path: str, timeout: int = 60) -> bool:
-        """Download a file from URL to dest_path. Returns True on success."""
+    def verify_checksum(path: str, sha256: Optional[str]) -> bool:
+        """Verify a file against an expected SHA-256 hex digest.
+
+        None means "no checksum published" and passes. Hashing streams the
+        file (O(1) memory): hashlib.file_digest on Python 3.11+, a 1 MiB
+        chunked update loop otherwise.
+        """
+        if sha256 is None:
+            return True
+        import hashlib
+
+        try:
+            with open(path, 'rb') as f:
+                if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                    digest = hashlib.file_digest(f, 'sha256').hexdigest()
+                else:
+                    h = hashlib.sha256()
+                    while chunk := f.read(1 << 20):
+                        h.update(chunk)
+                    digest = h.hexdigest()
+        except OSError:
+            return False
+        return digest == sha256.lower()
+
+    @staticmethod
+    def download_archive(url: str, dest_path: str, timeout: int = 60,
+                         sha256: Optional[str] = None) -> bool:
+        """Download a file from URL to dest_path. Returns True on success.
+
+        When *sha256* is given the download is verified before it replaces
+        dest_path; a mismatch discards the temp file and fails.
+        """
         import urllib.error
         import urllib.request
 
@@ -323,11 +367,12 @@ class DataManager:
             req = urllib.request.Request(url, headers={'User-Agent': 'trcc-linux'})
             with urllib.request.urlopen(req, timeout=timeout) as resp:
                 with open(tmp_path, 'wb') as f:
-                    while True:
-                        chunk = resp.read(65536)
-                        if not chunk:
-                            break
-                        f.write(chunk)
+                    # No progress callback here — let copyfileobj pump
+                    # 1 MiB chunks instead of a Python read loop
+                    shutil.copyfileobj(resp, f, length=1 << 20)
+            if not DataManager.verify_checksum(tmp_path, sha256):
+                log.warning("Checksum mismatch for %s", os.path.basename(dest_path))
+                return False
             os.replace(tmp_path, dest_path)
             size_kb = os.path.getsize(dest_path) / 1024
             log.info("Downloaded %s (%.0f KB)", os.path.basename(dest_path), size_kb)
@@ -470,6 +515,9 @@ class DataManager:
         DataManager.ensure_web(width, height)
         DataManager.ensure_web_masks(width, height)
         DataManager.mark_resolution_installed(width, height)
+        # New content may change which dir (pkg vs user) wins the lookup
+        DataManager.get_web_dir.cache_clear()
+        DataManager.get_web_masks_dir.cache_clear()
 
     # ------------------------------------------------------------------
     # Resolution installation tracking
@@ -520,8 +568,13 @@ class DataManager:
     # ------------------------------------------------------------------
 
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def get_web_dir(width: int, height: int) -> str:
-        """Get cloud theme Web directory for a resolution."""
+        """Get cloud theme Web directory for a resolution.
+
+        Cached per resolution (called on every playback path resolve);
+        ensure_* invalidates after extracting new content.
+        """
         res_key = f'{width}{height}'
         pkg_dir = os.path.join(DATA_DIR, 'web', res_key)
         if os.path.isdir(pkg_dir) and os.listdir(pkg_dir):
@@ -532,8 +585,12 @@ class DataManager:
         return pkg_dir
 
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def get_web_masks_dir(width: int, height: int) -> str:
-        """Get cloud masks directory for a resolution."""
+        """Get cloud masks directory for a resolution.
+
+        Cached per resolution; ensure_* invalidates after extraction.
+        """
         res_key = f'zt{width}{height}'
         pkg_dir = os.path.join(DATA_DIR, 'web', res_key)
         if ThemeDir.has_themes(pkg_dir):
@@ -551,14 +608,24 @@ class DataManager:
 class Resources:
     """GUI resource file finding and search path management."""
 
+    # Memoized hits keyed on (filename, paths) — assets don't move during
+    # a session. Misses are never cached so freshly extracted content is
+    # still found on the next lookup.
+    _find_cache: dict = {}
+
     @staticmethod
     def find(filename: str, search_paths: Optional[list] = None) -> Optional[str]:
         """Find a resource file in search paths."""
         if search_paths is None:
             search_paths = RESOURCE_SEARCH_PATHS
+        key = (filename, tuple(search_paths))
+        cached = Resources._find_cache.get(key)
+        if cached is not None:
+            return cached
         for path in search_paths:
             full_path = os.path.join(path, filename)
             if os.path.exists(full_path):
+                Resources._find_cache[key] = full_path
                 return full_path
         return None
 
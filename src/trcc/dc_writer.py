@@ -476,6 +476,21 @@ class DcWriter:
         # Write config1.dc from parsed config
         DcWriter.write(theme, os.path.join(theme_path, "config1.dc"))
 
+    @staticmethod
+    def parse_tr_config(tr_path: str) -> ThemeConfig:
+        """Read only the config block of a .tr file.
+
+        Fast path for callers that inspect scalar fields: no directory is
+        created and the embedded images are never decoded or written.
+        """
+        with open(tr_path, 'rb') as f:
+            data = f.read()
+
+        if len(data) < 4 or data[0:4] != b'\xdd\xdc\xdd\xdc':
+            raise ValueError("Invalid .tr file: wrong magic header")
+
+        return DcWriter._read_tr_config(BinaryReader(data, pos=4))
+
     @staticmethod
     def _read_tr_config(reader: BinaryReader) -> ThemeConfig:
         """Read ThemeConfig from .tr binary stream (after magic header)."""
@@ -627,6 +642,7 @@ save_theme = DcWriter.save_theme
 write_config_json = DcWriter.write_json
 export_theme = DcWriter.export_theme
 import_theme = DcWriter.import_theme
+parse_tr_config = DcWriter.parse_tr_config
 write_carousel_config = DcWriter.write_carousel
 read_carousel_config = DcWriter.read_carousel
 
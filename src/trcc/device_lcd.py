@@ -11,7 +11,9 @@ from .core.models import LCDDeviceConfig
 from .device_detector import DetectedDevice, detect_devices, get_default_device
 from .device_scsi import ScsiDevice
 from .services.device import DeviceService
-from .services.image import ImageService
+
+# ImageService (numpy + PIL) is imported lazily inside the frame methods so
+# importing LCDDriver for detection/header work doesn't pay for image deps.
 
 log = logging.getLogger(__name__)
 
@@ -19,6 +21,11 @@ log = logging.getLogger(__name__)
 class LCDDriver:
     """Unified LCD driver with auto-detection and implementation selection"""
 
+    # Per-resolution frame plan, built on first send and reused each frame
+    # (class-level defaults so bare instances created via __new__ still work)
+    _chunk_plan: Optional[list] = None
+    _chunk_plan_resolution: Optional[tuple] = None
+
     def __init__(self, device_path: Optional[str] = None, vid: Optional[int] = None, pid: Optional[int] = None, auto_detect_resolution: bool = True):
         """
         Initialize LCD driver.
@@ -125,10 +132,17 @@ class LCDDriver:
         if force_init or not self.initialized:
             self.init_device()
 
-        # Get frame chunks for current resolution
-        chunks = ScsiDevice._get_frame_chunks(self.implementation.width,
-                                   self.implementation.height)
-        total_size = sum(size for _, size in chunks)
+        # Chunk layout + headers are fixed per resolution: build once,
+        # reuse for every subsequent frame (streaming sends these 30x/s).
+        if self._chunk_plan_resolution != self.implementation.resolution:
+            chunks = ScsiDevice._get_frame_chunks(self.implementation.width,
+                                       self.implementation.height)
+            self._chunk_plan = [
+                (size, ScsiDevice._build_header(cmd, size))
+                for cmd, size in chunks
+            ]
+            self._chunk_plan_resolution = self.implementation.resolution
+        total_size = sum(size for size, _ in self._chunk_plan)
 
         # Pad image data if needed
         if len(image_data) < total_size:
@@ -136,11 +150,12 @@ class LCDDriver:
 
         # Send chunks
         assert self.device_path is not None
-        log.debug("Sending frame: %d bytes in %d chunks", total_size, len(chunks))
+        log.debug("Sending frame: %d bytes in %d chunks",
+                  total_size, len(self._chunk_plan))
+        view = memoryview(image_data)  # zero-copy per-chunk slices
         offset = 0
-        for cmd, size in chunks:
-            header = ScsiDevice._build_header(cmd, size)
-            ScsiDevice._scsi_write(self.device_path, header, image_data[offset:offset + size])
+        for size, header in self._chunk_plan:
+            ScsiDevice._scsi_write(self.device_path, header, view[offset:offset + size])
             offset += size
 
     def create_solid_color(self, r: int, g: int, b: int) -> bytes:
@@ -148,11 +163,18 @@ class LCDDriver:
         if not self.implementation:
             raise RuntimeError("No implementation loaded")
 
+        import numpy as np
+
+        from .services.image import ImageService
+
         width, height = self.implementation.resolution
         byte_order = ImageService.byte_order_for('scsi',
                                                  self.implementation.resolution)
         pixel = ImageService.rgb_to_bytes(r, g, b, byte_order)
-        return pixel * (width * height)
+        # Vectorized fill: one store loop in C instead of repeating the
+        # 2-byte pattern through the interpreter.
+        return np.full(width * height, int.from_bytes(pixel, 'big'),
+                       dtype='>u2').tobytes()
 
     def load_image(self, path: str) -> bytes:
         """Load and convert image to device format"""
@@ -161,10 +183,16 @@ class LCDDriver:
 
         try:
             from PIL import Image
+
+            from .services.image import ImageService
             width, height = self.implementation.resolution
             img = Image.open(path).convert('RGB').resize((width, height))
             byte_order = ImageService.byte_order_for(
                 'scsi', self.implementation.resolution)
+            if self.implementation.pixel_format == 'RGB565':
+                # Vectorized: one numpy pass instead of w*h rgb_to_bytes calls.
+                return ImageService.to_rgb565(img, byte_order)
+            # Fallback for exotic formats: per-pixel conversion.
             data = bytearray()
             for y in range(height):
                 for x in range(width):
@@ -10,8 +10,8 @@ auto-detection during device discovery.
 """
 
 import binascii
+import functools
 import logging
-import struct
 import subprocess
 import tempfile
 import time
@@ -55,7 +55,8 @@ class ScsiDevice:
     # --- Low-level SCSI helpers (Mode 3 protocol) ---
 
     @staticmethod
-    def _get_frame_chunks(width: int, height: int) -> list:
+    @functools.lru_cache(maxsize=16)
+    def _get_frame_chunks(width: int, height: int) -> tuple:
         """Calculate frame chunk commands for a given resolution.
 
         Each chunk is up to 64 KiB. The command encodes the chunk index in
@@ -63,6 +64,12 @@ class ScsiDevice:
 
         For 320x320: 4 chunks (3x64K + 8K = 204,800 bytes)
         For 480x480: 8 chunks (7x64K + 2K = 460,800 bytes)
+
+        Cached per (width, height): only a handful of resolutions exist
+        and the layout is deterministic, so every frame push past the
+        first shares one immutable tuple. The build itself stays a plain
+        loop — it runs once per resolution over at most ~10 chunks, below
+        any vectorization payoff.
         """
         total = width * height * 2  # RGB565: 2 bytes per pixel
         chunks = []
@@ -74,18 +81,32 @@ class ScsiDevice:
             chunks.append((cmd, size))
             offset += size
             idx += 1
-        return chunks
+        return tuple(chunks)
 
     @staticmethod
     def _crc32(data: bytes) -> int:
+        # Protocol requires the standard zlib CRC-32 polynomial (0xEDB88320);
+        # binascii.crc32 is CPython's C implementation of exactly that, with
+        # hardware acceleration where the interpreter's zlib build has it.
+        # CRC32C variants (crc32c/ISA-L wheels) use a different polynomial
+        # and are NOT interchangeable here; the only caller checksums the
+        # 16-byte header, so there is no payload-sized buffer to speed up.
         return binascii.crc32(data) & 0xFFFFFFFF
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def _build_header(cmd: int, size: int) -> bytes:
-        """Build 20-byte SCSI command header: cmd(4) + zeros(8) + size(4) + crc32(4)."""
-        header_16 = struct.pack('<I', cmd) + b'\x00' * 8 + struct.pack('<I', size)
+        """Build 20-byte SCSI command header: cmd(4) + zeros(8) + size(4) + crc32(4).
+
+        Cached: streaming reuses a handful of (cmd, size) tuples per session,
+        so the CRC is computed once per tuple instead of once per frame.
+        """
+        # SWAR-style pack: cmd sits in bits [0:32), size in bits [96:128)
+        # of one 16-byte little-endian integer (zeros in between fall out
+        # of the int), so assembly is a single C-level to_bytes.
+        header_16 = (cmd | (size << 96)).to_bytes(16, 'little')
         crc = ScsiDevice._crc32(header_16)
-        return header_16 + struct.pack('<I', crc)
+        return header_16 + crc.to_bytes(4, 'little')
 
     @staticmethod
     def _scsi_read(dev: str, cdb: bytes, length: int) -> bytes:
@@ -157,10 +178,14 @@ class ScsiDevice:
         if len(rgb565_data) < total_size:
             rgb565_data += b'\x00' * (total_size - len(rgb565_data))
 
+        # memoryview slices hand each chunk to the writer without copying
+        # 64 KiB per chunk out of the frame buffer. (A single writev is not
+        # possible here: each chunk is its own sg_raw command.)
+        view = memoryview(rgb565_data)
         offset = 0
         for cmd, size in chunks:
             header = ScsiDevice._build_header(cmd, size)
-            ScsiDevice._scsi_write(dev, header, rgb565_data[offset:offset + size])
+            ScsiDevice._scsi_write(dev, header, view[offset:offset + size])
             offset += size
 
     # --- Instance methods ---
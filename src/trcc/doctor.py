@@ -6,6 +6,7 @@ Usage: trcc doctor
 from __future__ import annotations
 
 import ctypes.util
+import functools
 import os
 import platform
 import shutil
@@ -96,8 +97,13 @@ def _read_os_release() -> dict[str, str]:
     return result
 
 
+@functools.cache
 def _detect_pkg_manager() -> str | None:
-    """Detect the system package manager from os-release."""
+    """Detect the system package manager from os-release.
+
+    Cached: the distro doesn't change mid-process. Tests that patch
+    _read_os_release must call _detect_pkg_manager.cache_clear().
+    """
     info = _read_os_release()
     distro_id = info.get('ID', '').lower()
 
@@ -172,11 +178,17 @@ def _check_python_module(
     return True  # optional — not a failure
 
 
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    """shutil.which with a per-process cache ($PATH is stable here)."""
+    return shutil.which(name)
+
+
 def _check_binary(
     name: str, required: bool, pm: str | None, note: str = '',
 ) -> bool:
     """Check if a CLI binary is on PATH. Return True if OK."""
-    if shutil.which(name):
+    if _which(name):
         print(f"  {_OK}  {name}")
         return True
     suffix = f" ({note})" if note else ""
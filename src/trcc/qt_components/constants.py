@@ -5,6 +5,8 @@ All coordinate values match Windows TRCC InitializeComponent() exactly.
 Centralizes magic numbers so they're defined once and referenced everywhere.
 """
 
+import functools
+
 
 class Colors:
     """Central color palette used across all components."""
@@ -418,6 +420,7 @@ class Styles:
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def thumb_selected(cls_name: str) -> str:
         return f"""
             {cls_name} {{
@@ -428,6 +431,7 @@ class Styles:
         """
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def thumb_normal(cls_name: str) -> str:
         return f"""
             {cls_name} {{
@@ -442,6 +446,7 @@ class Styles:
         """
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def thumb_non_local(cls_name: str) -> str:
         return f"""
             {cls_name} {{
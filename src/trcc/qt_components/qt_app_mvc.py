@@ -12,6 +12,7 @@ Visual polish matches Windows TRCC exactly:
 """
 from __future__ import annotations
 
+import functools
 import locale
 import logging
 import os
@@ -67,8 +68,13 @@ log = logging.getLogger(__name__)
 LOCALE_TO_LANG = Layout.LOCALE_TO_LANG
 
 
+@functools.lru_cache(maxsize=1)
 def detect_language() -> str:
-    """Detect system language and return Windows asset suffix."""
+    """Detect system language and return Windows asset suffix.
+
+    Memoized: the locale cannot change mid-session and menu rebuilds
+    call this repeatedly. Tests that patch locale must cache_clear().
+    """
     try:
         lang = (locale.getlocale()[0]
                 or os.environ.get('LANG', '').split('.')[0]
@@ -76,11 +82,11 @@ def detect_language() -> str:
     except Exception:
         lang = 'en'
 
-    # Try exact match first
+    # O(1) exact-match lookup, then O(1) prefix lookup ('en_US' -> 'en');
+    # no linear scan over the locale table.
     if lang in LOCALE_TO_LANG:
         return LOCALE_TO_LANG[lang]
 
-    # Try language prefix (e.g., 'en_US' -> 'en')
     prefix = lang.split('_')[0]
     if prefix in LOCALE_TO_LANG:
         return LOCALE_TO_LANG[prefix]
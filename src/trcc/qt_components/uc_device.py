@@ -7,6 +7,8 @@ Shows connected LCD devices as clickable buttons.
 
 from __future__ import annotations
 
+import functools
+
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QLabel, QPushButton, QWidget
 
@@ -75,8 +77,24 @@ def _get_device_images(device_info: dict) -> tuple[str | None, str | None]:
     image.  After the HID handshake resolves the actual product, the button
     image is updated via PM_TO_BUTTON_IMAGE.
     """
-    button_image = device_info.get('button_image', '')
-    protocol = device_info.get('protocol', 'scsi')
+    return _resolve_device_images(
+        device_info.get('button_image', ''),
+        device_info.get('protocol', 'scsi'),
+        device_info.get('model', ''),
+        device_info.get('name', ''),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_device_images(
+    button_image: str, protocol: str, model: str, name: str,
+) -> tuple[str | None, str | None]:
+    """Resolve device button images, memoized per device identity.
+
+    Bundled A1*.png assets never change at runtime, so repeated sidebar
+    repaints skip the asset_exists() stat probes (negative results are
+    cached too).
+    """
 
     # For HID devices, skip the generic A1CZTV default — show text name
     # until the handshake identifies the actual product.
@@ -97,7 +115,6 @@ def _get_device_images(device_info: dict) -> tuple[str | None, str | None]:
             return normal, active
 
     # Try model field
-    model = device_info.get('model', '')
     if model in DEVICE_IMAGE_MAP:
         base = DEVICE_IMAGE_MAP[model]
         normal = f"{base}.png"
@@ -106,7 +123,6 @@ def _get_device_images(device_info: dict) -> tuple[str | None, str | None]:
             return normal, active
 
     # Try name field as fallback
-    name = device_info.get('name', '')
     for model_key, img_base in DEVICE_IMAGE_MAP.items():
         if model_key.lower() in name.lower():
             normal = f"{img_base}.png"
@@ -213,23 +229,32 @@ class UCDevice(BasePanel):
         self.no_devices_label.setVisible(not has_devices)
         self.hint_label.setVisible(not has_devices)
 
-        for i, device in enumerate(devices):
-            normal_name, active_name = _get_device_images(device)
-            x = Sizes.DEVICE_BTN_X
-            y = i * Sizes.DEVICE_BTN_SPACING
-            w = Sizes.DEVICE_BTN_W
-            h = Sizes.DEVICE_BTN_H
-
-            btn = create_image_button(
-                self.device_area, x, y, w, h,
-                normal_name, active_name,
-                checkable=True,
-                fallback_text=device.get('name', 'Unknown')[:18],
-            )
-            btn.device_info = device  # type: ignore[attr-defined]
-            btn.clicked.connect(lambda _=False, d=device: self._on_device_clicked(d))
-            btn.show()
-            self.device_buttons.append(btn)
+        # Suppress repaints while the list rebuilds: one paint pass after
+        # the loop instead of a geometry/paint event per button.
+        self.device_area.setUpdatesEnabled(False)
+        try:
+            for i, device in enumerate(devices):
+                normal_name, active_name = _get_device_images(device)
+                x = Sizes.DEVICE_BTN_X
+                y = i * Sizes.DEVICE_BTN_SPACING
+                w = Sizes.DEVICE_BTN_W
+                h = Sizes.DEVICE_BTN_H
+
+                btn = create_image_button(
+                    self.device_area, x, y, w, h,
+                    normal_name, active_name,
+                    checkable=True,
+                    fallback_text=device.get('name', 'Unknown')[:18],
+                )
+                # Dynamic attr on the QPushButton; __slots__ can't trim this —
+                # Shiboken widget instances always carry a __dict__.
+                btn.device_info = device  # type: ignore[attr-defined]
+                btn.clicked.connect(
+                    lambda _=False, d=device: self._on_device_clicked(d))
+                btn.show()
+                self.device_buttons.append(btn)
+        finally:
+            self.device_area.setUpdatesEnabled(True)
 
     def _detect_devices(self) -> None:
         """Detect connected LCD devices."""
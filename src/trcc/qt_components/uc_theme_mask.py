@@ -169,6 +169,8 @@ class UCThemeMask(DownloadableThemeBrowser):
                     data = response.read()
 
                 try:
+                    # Read-only: compression of these cloud bundles is
+                    # decided server-side (members are PNGs either way)
                     with zipfile.ZipFile(io.BytesIO(data)) as zf:
                         mask_dir.mkdir(parents=True, exist_ok=True)
                         for info in zf.infolist():
@@ -6,14 +6,31 @@ Business logic shared by all driving adapters:
 - api.py (FastAPI REST)
 """
 
-from .device import DeviceService
-from .display import DisplayService
-from .image import ImageService
-from .led import LEDService
-from .media import MediaService
-from .overlay import OverlayService
-from .system import SystemService
-from .theme import ThemeService
+# Services resolve lazily (PEP 562): importing one service module (or a
+# module that depends on one) no longer loads the full image/media stack.
+_SERVICE_MODULES = {
+    'DeviceService': '.device',
+    'DisplayService': '.display',
+    'ImageService': '.image',
+    'LEDService': '.led',
+    'MediaService': '.media',
+    'OverlayService': '.overlay',
+    'SystemService': '.system',
+    'ThemeService': '.theme',
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _SERVICE_MODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module 'trcc.services' has no attribute {name!r}") from None
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache for subsequent lookups
+    return value
+
 
 __all__ = [
     'DeviceService',
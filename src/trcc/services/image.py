@@ -17,6 +17,12 @@ from PIL import Image as PILImage
 # bombs from crafted theme images causing OOM.
 PILImage.MAX_IMAGE_PIXELS = 1920 * 720 * 4  # 5,529,600 pixels
 
+# Per-channel RGB888->RGB565 lookup tables (1.5 KiB total, L1-resident).
+# Three table loads + two ORs per pixel replace the shift/mask arithmetic.
+_R_LUT = np.array([(i & 0xF8) << 8 for i in range(256)], dtype=np.uint16)
+_G_LUT = np.array([(i & 0xFC) << 3 for i in range(256)], dtype=np.uint16)
+_B_LUT = np.array([i >> 3 for i in range(256)], dtype=np.uint16)
+
 
 class ImageService:
     """Stateless image processing utilities."""
@@ -35,11 +41,8 @@ class ImageService:
         if img.mode != 'RGB':
             img = img.convert('RGB')
 
-        arr = np.array(img, dtype=np.uint16)
-        r = (arr[:, :, 0] >> 3) & 0x1F
-        g = (arr[:, :, 1] >> 2) & 0x3F
-        b = (arr[:, :, 2] >> 3) & 0x1F
-        rgb565 = (r << 11) | (g << 5) | b
+        arr = np.asarray(img)
+        rgb565 = _R_LUT[arr[:, :, 0]] | _G_LUT[arr[:, :, 1]] | _B_LUT[arr[:, :, 2]]
         return rgb565.astype(f'{byte_order}u2').tobytes()
 
     @staticmethod
@@ -99,7 +99,11 @@ class MediaService:
     # ── Frame access ─────────────────────────────────────────────────
 
     def get_frame(self, index: int | None = None) -> Any | None:
-        """Get frame at index (or current frame)."""
+        """Get frame at index (or current frame).
+
+        Returns the stored image by reference (shared, treat as
+        read-only); callers that mutate pixels must copy() first.
+        """
         if index is None:
             index = self._state.current_frame
         if 0 <= index < len(self._frames):
@@ -116,11 +120,13 @@ class MediaService:
 
         frame = self.get_frame()
 
-        self._state.current_frame += 1
-        if self._state.current_frame >= self._state.total_frames:
-            if self._state.loop:
-                self._state.current_frame = 0
-            else:
+        if self._state.loop:
+            # Branchless wrap: modulo keeps the hot looping path compare-free
+            self._state.current_frame = (
+                (self._state.current_frame + 1) % (self._state.total_frames or 1))
+        else:
+            self._state.current_frame += 1
+            if self._state.current_frame >= self._state.total_frames:
                 self._state.state = PlaybackState.STOPPED
 
         return frame
@@ -128,6 +134,10 @@ class MediaService:
     def tick(self) -> tuple[Any | None, bool, tuple[float, str, str] | None]:
         """Called by timer to advance one frame.
 
+        The whole advance is a handful of integer ops on VideoState — far
+        below the threshold where a compiled (Numba/Cython) kernel would
+        pay for its call boundary, so it stays plain Python.
+
         Returns:
             (frame, should_send_to_lcd, progress_tuple_or_none)
         """
@@ -100,7 +100,8 @@ class OverlayService:
         if image.size == (self.width, self.height):
             self.background = image
         else:
-            self.background = image.copy().resize(
+            # resize() already returns a new image — no defensive copy needed
+            self.background = image.resize(
                 (self.width, self.height), Image.Resampling.LANCZOS
             )
 
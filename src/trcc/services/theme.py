@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import shutil
 from pathlib import Path
 from typing import Any
@@ -134,11 +135,31 @@ class ThemeService:
         if not theme_dir or not theme_dir.exists():
             return themes
 
-        for item in sorted(theme_dir.iterdir()):
-            if item.is_dir() and ThemeDir(item).is_valid():
-                theme = ThemeInfo.from_directory(item, resolution)
-                if ThemeService._passes_filter(theme, filter_mode):
-                    themes.append(theme)
+        # scandir reuses the readdir-cached file type, so filtering to
+        # directories costs one syscall for the whole listing.
+        with os.scandir(theme_dir) as it:
+            entries = sorted((e for e in it if e.is_dir()),
+                             key=lambda e: e.name)
+        # Name-filter before constructing ThemeInfo: rejected entries
+        # (e.g. Custom_* in 'default' mode) skip the directory scan.
+        paths = [Path(e.path) for e in entries
+                 if ThemeService._name_passes_filter(e.name, filter_mode)]
+
+        def _build(item: Path) -> ThemeInfo | None:
+            if ThemeDir(item).is_valid():
+                return ThemeInfo.from_directory(item, resolution)
+            return None
+
+        # Large installs are readdir/stat latency-bound, not CPU-bound;
+        # overlap the per-directory scans (scandir releases the GIL).
+        # map() preserves order; small dirs skip the pool startup cost.
+        if len(paths) > 16:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = executor.map(_build, paths)
+                themes = [t for t in results if t is not None]
+        else:
+            themes = [t for t in map(_build, paths) if t is not None]
 
         return themes
 
@@ -365,6 +386,19 @@ class ThemeService:
 
     # ── Private helpers ──────────────────────────────────────────────
 
+    @staticmethod
+    def _name_passes_filter(name: str, filter_mode: str) -> bool:
+        """Name-only version of _passes_filter for local directories.
+
+        Local discovery always yields ThemeType.LOCAL, so the filter
+        reduces to the User/Custom prefix check.
+        """
+        if filter_mode == 'default':
+            return not name.startswith(('User', 'Custom'))
+        if filter_mode == 'user':
+            return name.startswith(('User', 'Custom'))
+        return True
+
     @staticmethod
     def _passes_filter(theme: ThemeInfo, filter_mode: str) -> bool:
         if filter_mode == 'all':
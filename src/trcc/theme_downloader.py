@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
@@ -97,6 +98,18 @@ def _resolve_pack_name(name: str) -> str:
     return _SHORT_ALIASES.get(name, name)
 
 
+# Compiled once: every resolution-string consumer shares this spec
+_RES_RE = re.compile(r'^(\d+)x(\d+)$')
+
+
+def parse_resolution(s: str) -> tuple[int, int] | None:
+    """Parse a 'WxH' resolution string. Returns (w, h) or None if malformed."""
+    m = _RES_RE.match(s)
+    if not m:
+        return None
+    return int(m[1]), int(m[2])
+
+
 # =========================================================================
 # ThemeDownloader — CLI adapter for DataManager
 # =========================================================================
@@ -115,35 +128,68 @@ class ThemeDownloader:
             return pkg
         return user  # default to user dir for installs
 
+    # Scan results keyed on (path, mtime_ns): installing or removing a
+    # pack rewrites the directory and bumps its mtime, so invalidation
+    # is automatic and repeated UI checks cost one stat.
+    _scan_cache: dict = {}
+
+    @staticmethod
+    def _scan_theme_dir(w: int, h: int) -> tuple[int, int]:
+        """One cached scan -> (total entries, theme subdirectories)."""
+        d = ThemeDownloader._theme_dir(w, h)
+        try:
+            mtime = d.stat().st_mtime_ns
+        except OSError:
+            return (0, 0)
+        key = (str(d), mtime)
+        cached = ThemeDownloader._scan_cache.get(key)
+        if cached is None:
+            entries = 0
+            dirs = 0
+            with os.scandir(d) as it:
+                for entry in it:
+                    entries += 1
+                    if entry.is_dir():
+                        dirs += 1
+            cached = (entries, dirs)
+            ThemeDownloader._scan_cache[key] = cached
+        return cached
+
     @staticmethod
     def _is_installed(w: int, h: int) -> bool:
         """Check if themes are extracted for a resolution."""
-        d = ThemeDownloader._theme_dir(w, h)
-        return d.exists() and any(d.iterdir())
+        return ThemeDownloader._scan_theme_dir(w, h)[0] > 0
 
     @staticmethod
     def _theme_count(w: int, h: int) -> int:
         """Count theme subdirectories for a resolution."""
-        d = ThemeDownloader._theme_dir(w, h)
-        if not d.exists():
-            return 0
-        return sum(1 for item in d.iterdir() if item.is_dir())
+        return ThemeDownloader._scan_theme_dir(w, h)[1]
 
     # ── Public API ────────────────────────────────────────────────────
 
+    @staticmethod
+    def _install_status(info: PackInfo) -> str:
+        """' [installed, N themes]' suffix, or '' when not installed."""
+        if not ThemeDownloader._is_installed(info.width, info.height):
+            return ""
+        count = ThemeDownloader._theme_count(info.width, info.height)
+        return f" [installed, {count} themes]"
+
     @staticmethod
     def list_available() -> None:
         """List available theme packs with install status."""
+        from concurrent.futures import ThreadPoolExecutor
+
         print("Available theme packs:")
         print("=" * 60)
 
-        for pack_id, info in THEME_REGISTRY.items():
-            installed = ThemeDownloader._is_installed(info.width, info.height)
-            status = ""
-            if installed:
-                count = ThemeDownloader._theme_count(info.width, info.height)
-                status = f" [installed, {count} themes]"
+        # Status checks are readdir/stat latency-bound across a dozen
+        # resolution dirs; overlap them and print in registry order.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            statuses = list(executor.map(ThemeDownloader._install_status,
+                                         THEME_REGISTRY.values()))
 
+        for (pack_id, info), status in zip(THEME_REGISTRY.items(), statuses):
             alias = f" (or: themes-{info.width})" if info.width == info.height else ""
             size = f"{info.size_kb}KB" if info.size_kb > 0 else "on-demand"
 
@@ -0,0 +1,10 @@
+"""Shared pytest configuration for the TRCC test suite."""
+
+import os
+import tempfile
+
+# Point tempfile at tmpfs when available: the suite creates/destroys
+# hundreds of scratch dirs (mkdtemp + rmtree per test), and RAM-backed
+# /dev/shm keeps that metadata churn off the disk.
+if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+    tempfile.tempdir = '/dev/shm'
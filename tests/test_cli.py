@@ -16,11 +16,15 @@ Tests cover:
 - conf.get_selected_device() / conf.save_selected_device() helpers
 """
 
+import copy
 import os
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from PIL import Image
 
 from trcc.cli import (
     DeviceCommands,
@@ -85,10 +89,25 @@ def _make_device_info(
     )
 
 
+# Shared defaults -- tests only read attributes, so one instance is enough.
+_DEV_SG0 = _make_device_info(path='/dev/sg0')
+_DEV_SG1 = _make_device_info(path='/dev/sg1')
+
+
+# Spec'd once from the real PIL class so attribute handling is uniform;
+# tests take a shallow copy when they need a fresh image mock.
+_PIL_IMAGE_PROTO = Mock(spec=Image.Image)
+_PIL_IMAGE_PROTO.size = (320, 320)
+_PIL_IMAGE_PROTO.mode = 'RGBA'
+_PIL_IMAGE_PROTO.width = 320
+_PIL_IMAGE_PROTO.height = 320
+_PIL_IMAGE_PROTO.convert.return_value = _PIL_IMAGE_PROTO
+
+
 def _mock_service(device=None, devices=None):
     """Create a mock DeviceService with optional pre-selected device."""
     svc = MagicMock()
-    dev = device or _make_device_info()
+    dev = device or _DEV_SG0
     svc.selected = dev
     svc.devices = devices or [dev]
     svc.detect.return_value = svc.devices
@@ -925,7 +944,7 @@ class TestResume(unittest.TestCase):
 
     def test_no_saved_theme(self):
         """Device with no saved theme -> returns 1."""
-        dev = _make_device_info()
+        dev = _DEV_SG0
         svc = MagicMock()
         svc.detect.return_value = [dev]
         with patch('trcc.services.DeviceService', return_value=svc), \
@@ -944,7 +963,7 @@ class TestResume(unittest.TestCase):
             img = Image.new('RGB', (10, 10), color=(255, 0, 0))
             img.save(os.path.join(theme_dir, '00.png'))
 
-            dev = _make_device_info()
+            dev = _DEV_SG0
             svc = MagicMock()
             svc.detect.return_value = [dev]
             svc.send_pil.return_value = True
@@ -969,7 +988,7 @@ class TestResume(unittest.TestCase):
             img = Image.new('RGB', (10, 10), color=(0, 255, 0))
             img.save(os.path.join(theme_dir, '00.png'))
 
-            dev = _make_device_info()
+            dev = _DEV_SG0
             svc = MagicMock()
             svc.detect.return_value = [dev]
             svc.send_pil.return_value = True
@@ -995,7 +1014,7 @@ class TestResume(unittest.TestCase):
 
     def test_theme_path_not_found(self):
         """Theme path doesn't exist on disk -> skipped."""
-        dev = _make_device_info()
+        dev = _DEV_SG0
         svc = MagicMock()
         svc.detect.return_value = [dev]
         with patch('trcc.services.DeviceService', return_value=svc), \
@@ -1565,7 +1584,7 @@ class TestGetService(unittest.TestCase):
 
     def test_selects_by_path(self):
         """Explicit device_path selects matching device."""
-        dev = _make_device_info(path='/dev/sg1')
+        dev = _DEV_SG1
         svc = MagicMock()
         svc.devices = [dev]
         svc.selected = None
@@ -1576,7 +1595,7 @@ class TestGetService(unittest.TestCase):
 
     def test_falls_back_to_saved(self):
         """No explicit path -> uses saved selection."""
-        dev = _make_device_info(path='/dev/sg0')
+        dev = _DEV_SG0
         svc = MagicMock()
         svc.devices = [dev]
         svc.selected = None
@@ -1588,7 +1607,7 @@ class TestGetService(unittest.TestCase):
 
     def test_no_match_selects_first(self):
         """Explicit path not found -> selects first device."""
-        dev = _make_device_info(path='/dev/sg0')
+        dev = _DEV_SG0
         svc = MagicMock()
         svc.devices = [dev]
         svc.selected = None
@@ -1602,56 +1621,40 @@ class TestGetService(unittest.TestCase):
 # Brightness / Rotation
 # ---------------------------------------------------------------------------
 
-class TestSetBrightness(unittest.TestCase):
-    """Tests for DisplayCommands.set_brightness()."""
+_SETTER_PARAMS = [
+    ('set_brightness', 'brightness_level', [5, 0], 2),
+    ('set_rotation', 'rotation', [45, 360], 180),
+]
 
-    def test_invalid_level(self):
-        """Level outside 1-3 returns error."""
-        self.assertEqual(DisplayCommands.set_brightness(5), 1)
-        self.assertEqual(DisplayCommands.set_brightness(0), 1)
 
-    def test_no_device(self):
-        """No device returns 1."""
-        svc = _mock_service()
-        svc.selected = None
-        with patch.object(DeviceCommands, '_get_service', return_value=svc):
-            self.assertEqual(DisplayCommands.set_brightness(2), 1)
-
-    def test_success(self):
-        """Valid level persists to config."""
-        svc = _mock_service()
-        with patch.object(DeviceCommands, '_get_service', return_value=svc), \
-             patch('trcc.conf.Settings.device_config_key', return_value='0:87cd_70db'), \
-             patch('trcc.conf.Settings.save_device_setting') as mock_save:
-            result = DisplayCommands.set_brightness(2)
-            self.assertEqual(result, 0)
-            mock_save.assert_called_once_with('0:87cd_70db', 'brightness_level', 2)
+class TestValidatedDisplaySetter:
+    """Tests for DisplayCommands.set_brightness() / set_rotation().
 
+    Both setters share the same shape (invalid-value, no-device, success),
+    so one parameterized class covers them.
+    """
 
-class TestSetRotation(unittest.TestCase):
-    """Tests for DisplayCommands.set_rotation()."""
+    # Pure-validation paths (invalid value -> 1) live in
+    # test_cli_validation.py so they skip the service-mock setup here.
 
-    def test_invalid_degrees(self):
-        """Invalid rotation returns error."""
-        self.assertEqual(DisplayCommands.set_rotation(45), 1)
-        self.assertEqual(DisplayCommands.set_rotation(360), 1)
-
-    def test_no_device(self):
+    @pytest.mark.parametrize('method, key, invalids, valid', _SETTER_PARAMS)
+    def test_no_device(self, method, key, invalids, valid):
         """No device returns 1."""
         svc = _mock_service()
         svc.selected = None
         with patch.object(DeviceCommands, '_get_service', return_value=svc):
-            self.assertEqual(DisplayCommands.set_rotation(90), 1)
+            assert getattr(DisplayCommands, method)(valid) == 1
 
-    def test_success(self):
-        """Valid rotation persists to config."""
+    @pytest.mark.parametrize('method, key, invalids, valid', _SETTER_PARAMS)
+    def test_success(self, method, key, invalids, valid):
+        """Valid value persists to config."""
         svc = _mock_service()
         with patch.object(DeviceCommands, '_get_service', return_value=svc), \
              patch('trcc.conf.Settings.device_config_key', return_value='0:87cd_70db'), \
              patch('trcc.conf.Settings.save_device_setting') as mock_save:
-            result = DisplayCommands.set_rotation(180)
-            self.assertEqual(result, 0)
-            mock_save.assert_called_once_with('0:87cd_70db', 'rotation', 180)
+            result = getattr(DisplayCommands, method)(valid)
+            assert result == 0
+            mock_save.assert_called_once_with('0:87cd_70db', key, valid)
 
 
 # ---------------------------------------------------------------------------
@@ -1702,12 +1705,7 @@ class TestLoadMask(unittest.TestCase):
     def test_success_file(self):
         """PNG file is loaded and sent."""
         svc = _mock_service()
-        mock_img = MagicMock()
-        mock_img.size = (320, 320)
-        mock_img.mode = 'RGBA'
-        mock_img.convert.return_value = mock_img
-        mock_img.width = 320
-        mock_img.height = 320
+        mock_img = copy.copy(_PIL_IMAGE_PROTO)
         with patch('os.path.exists', return_value=True), \
              patch.object(DeviceCommands, '_get_service', return_value=svc), \
              patch('PIL.Image.open', return_value=mock_img), \
@@ -1887,11 +1885,6 @@ class TestLEDCommands(unittest.TestCase):
         mock_svc.send_tick.return_value = True
         return mock_svc, "LED: AX120 (18 LEDs)"
 
-    def test_set_color_invalid_hex(self):
-        """Invalid hex returns 1."""
-        self.assertEqual(LEDCommands.set_color('xyz'), 1)
-        self.assertEqual(LEDCommands.set_color('ff'), 1)
-
     def test_set_color_no_device(self):
         """No LED device returns 1."""
         with patch.object(LEDCommands, '_get_led_service',
@@ -1909,14 +1902,6 @@ class TestLEDCommands(unittest.TestCase):
             mock_svc.send_tick.assert_called_once()
             mock_svc.save_config.assert_called_once()
 
-    def test_set_mode_invalid(self):
-        """Unknown mode returns 1."""
-        with patch.object(LEDCommands, '_get_led_service',
-                          return_value=(MagicMock(), "LED")):
-            # set_mode checks mode_map before using service
-            pass
-        self.assertEqual(LEDCommands.set_mode('explosion'), 1)
-
     def test_set_mode_static(self):
         """Static mode sets and sends once (no animation loop)."""
         mock_svc, status = self._mock_led_svc()
@@ -1926,11 +1911,6 @@ class TestLEDCommands(unittest.TestCase):
             self.assertEqual(result, 0)
             mock_svc.send_tick.assert_called_once()
 
-    def test_set_brightness_invalid(self):
-        """Out of range brightness returns 1."""
-        self.assertEqual(LEDCommands.set_led_brightness(-1), 1)
-        self.assertEqual(LEDCommands.set_led_brightness(101), 1)
-
     def test_set_brightness_success(self):
         """Valid brightness sets and sends."""
         mock_svc, status = self._mock_led_svc()
@@ -1973,7 +1953,7 @@ class TestThemeSave(unittest.TestCase):
 
     def test_save_no_current_theme(self):
         """No current theme returns 1."""
-        dev = _make_device_info()
+        dev = _DEV_SG0
         mock_svc = MagicMock()
         mock_svc.selected = dev
         with patch.object(DeviceCommands, '_get_service', return_value=mock_svc), \
@@ -1983,7 +1963,7 @@ class TestThemeSave(unittest.TestCase):
 
     def test_save_success(self):
         """Valid state saves theme."""
-        dev = _make_device_info()
+        dev = _DEV_SG0
         mock_svc = MagicMock()
         mock_svc.selected = dev
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -2069,7 +2049,7 @@ class TestThemeImport(unittest.TestCase):
 
     def test_import_success(self):
         """Valid .tr file imports theme."""
-        dev = _make_device_info()
+        dev = _DEV_SG0
         mock_svc = MagicMock()
         mock_svc.selected = dev
 
@@ -2085,7 +2065,7 @@ class TestThemeImport(unittest.TestCase):
 
     def test_import_failure(self):
         """Failed import returns 1."""
-        dev = _make_device_info()
+        dev = _DEV_SG0
         mock_svc = MagicMock()
         mock_svc.selected = dev
 
@@ -2104,10 +2084,6 @@ class TestThemeImport(unittest.TestCase):
 class TestLEDSensorSource(unittest.TestCase):
     """Tests for LEDCommands.set_sensor_source()."""
 
-    def test_invalid_source(self):
-        """Invalid source returns 1."""
-        self.assertEqual(LEDCommands.set_sensor_source('memory'), 1)
-
     def test_no_device(self):
         """No LED device returns 1."""
         with patch.object(LEDCommands, '_get_led_service',
@@ -2293,29 +2269,31 @@ class TestNewCommandDispatch(unittest.TestCase):
 # Backward-compat alias tests
 # ---------------------------------------------------------------------------
 
-class TestNewAliases(unittest.TestCase):
+class TestNewAliases:
     """Verify backward-compat aliases exist."""
 
-    def test_display_aliases(self):
-        self.assertIs(set_brightness, DisplayCommands.set_brightness)
-        self.assertIs(set_rotation, DisplayCommands.set_rotation)
-        self.assertIs(screencast, DisplayCommands.screencast)
-        self.assertIs(load_mask, DisplayCommands.load_mask)
-        self.assertIs(render_overlay, DisplayCommands.render_overlay)
-
-    def test_theme_aliases(self):
-        self.assertIs(list_themes, ThemeCommands.list_themes)
-        self.assertIs(load_theme, ThemeCommands.load_theme)
-        self.assertIs(save_theme, ThemeCommands.save_theme)
-        self.assertIs(export_theme, ThemeCommands.export_theme)
-        self.assertIs(import_theme, ThemeCommands.import_theme)
-
-    def test_led_aliases(self):
-        self.assertIs(led_color, LEDCommands.set_color)
-        self.assertIs(led_mode, LEDCommands.set_mode)
-        self.assertIs(led_brightness, LEDCommands.set_led_brightness)
-        self.assertIs(led_off, LEDCommands.led_off)
-        self.assertIs(led_sensor, LEDCommands.set_sensor_source)
+    @pytest.mark.parametrize('alias, target', [
+        # Display
+        (set_brightness, DisplayCommands.set_brightness),
+        (set_rotation, DisplayCommands.set_rotation),
+        (screencast, DisplayCommands.screencast),
+        (load_mask, DisplayCommands.load_mask),
+        (render_overlay, DisplayCommands.render_overlay),
+        # Theme
+        (list_themes, ThemeCommands.list_themes),
+        (load_theme, ThemeCommands.load_theme),
+        (save_theme, ThemeCommands.save_theme),
+        (export_theme, ThemeCommands.export_theme),
+        (import_theme, ThemeCommands.import_theme),
+        # LED
+        (led_color, LEDCommands.set_color),
+        (led_mode, LEDCommands.set_mode),
+        (led_brightness, LEDCommands.set_led_brightness),
+        (led_off, LEDCommands.led_off),
+        (led_sensor, LEDCommands.set_sensor_source),
+    ])
+    def test_alias(self, alias, target):
+        assert alias is target
 
 
 if __name__ == '__main__':
@@ -0,0 +1,61 @@
+"""
+Tests for cli -- pure argument-validation paths.
+
+These tests exercise command entry points that reject bad arguments
+before ever touching a device service, so they live apart from the
+heavier dispatch tests in test_cli.py: a pytest-xdist worker running
+only this file never pays the service-mock setup cost.
+
+Tests cover:
+- DisplayCommands.set_brightness() / set_rotation() range checks
+- LEDCommands.set_color() hex parsing rejects
+- LEDCommands.set_mode() unknown-mode reject
+- LEDCommands.set_led_brightness() range check
+- LEDCommands.set_sensor_source() unknown-source reject
+"""
+
+import unittest
+
+import pytest
+
+from trcc.cli import DisplayCommands, LEDCommands
+
+
+class TestDisplaySetterValidation:
+    """Range checks for set_brightness/set_rotation (service never used)."""
+
+    @pytest.mark.parametrize('method, invalids', [
+        ('set_brightness', [5, 0]),
+        ('set_rotation', [45, 360]),
+    ])
+    def test_invalid_value(self, method, invalids):
+        """Value outside the accepted range returns error."""
+        for invalid in invalids:
+            assert getattr(DisplayCommands, method)(invalid) == 1
+
+
+class TestLEDValidation(unittest.TestCase):
+    """Argument checks for LEDCommands (service never used)."""
+
+    def test_set_color_invalid_hex(self):
+        """Invalid hex returns 1."""
+        self.assertEqual(LEDCommands.set_color('xyz'), 1)
+        self.assertEqual(LEDCommands.set_color('ff'), 1)
+
+    def test_set_mode_invalid(self):
+        """Unknown mode returns 1."""
+        # set_mode checks mode_map before using service
+        self.assertEqual(LEDCommands.set_mode('explosion'), 1)
+
+    def test_set_brightness_invalid(self):
+        """Out of range brightness returns 1."""
+        self.assertEqual(LEDCommands.set_led_brightness(-1), 1)
+        self.assertEqual(LEDCommands.set_led_brightness(101), 1)
+
+    def test_invalid_source(self):
+        """Invalid source returns 1."""
+        self.assertEqual(LEDCommands.set_sensor_source('memory'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@ Business logic is tested in test_services.py. These tests verify:
 """
 
 import json
+import os
 import shutil
 import tempfile
 import unittest
@@ -67,6 +68,16 @@ def _make_test_image(w=320, h=320, color=(128, 0, 0)):
 # ThemeController
 # =============================================================================
 
+
+def _write_file(path, data: bytes) -> None:
+    """Create a fixture file with one open/write/close syscall trio."""
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 class TestThemeController(unittest.TestCase):
 
     def setUp(self):
@@ -109,8 +120,8 @@ class TestThemeController(unittest.TestCase):
         with tempfile.TemporaryDirectory() as tmp:
             theme_dir = Path(tmp) / 'Theme1'
             theme_dir.mkdir()
-            (theme_dir / '00.png').write_bytes(b'PNG')
-            (theme_dir / 'Theme.png').write_bytes(b'PNG')
+            _write_file(theme_dir / '00.png', b'PNG')
+            _write_file(theme_dir / 'Theme.png', b'PNG')
 
             self.ctrl.set_directories(local_dir=Path(tmp))
             self.ctrl.load_local_themes((320, 320))
@@ -125,7 +136,7 @@ class TestThemeController(unittest.TestCase):
         with tempfile.TemporaryDirectory() as tmp:
             theme_dir = Path(tmp) / 'T1'
             theme_dir.mkdir()
-            (theme_dir / '00.png').write_bytes(b'x')
+            _write_file(theme_dir / '00.png', b'x')
 
             self.ctrl.set_directories(local_dir=Path(tmp))
             self.ctrl.load_local_themes()
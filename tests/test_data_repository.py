@@ -366,6 +366,40 @@ class TestPerDeviceConfig(unittest.TestCase):
 
 # -- DataManager.extract_7z ------------------------------------------------
 
+# Precomputed oracle: sha256(b'theme data')
+_THEME_DATA_SHA = '8cb0bf25fd75c3ce1ff944fef28831278ce3b728507ea2a323198a8d3a614743'
+
+
+class TestVerifyChecksum(unittest.TestCase):
+    """Test streaming SHA-256 verification."""
+
+    def test_sha_oracle(self):
+        """Pinned constant matches a fresh hashlib computation."""
+        import hashlib
+        self.assertEqual(hashlib.sha256(b'theme data').hexdigest(),
+                         _THEME_DATA_SHA)
+
+    def test_none_checksum_passes(self):
+        self.assertTrue(DataManager.verify_checksum('/no/such/file', None))
+
+    def test_matching_checksum(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'pack.7z')
+            with open(path, 'wb') as f:
+                f.write(b'theme data')
+            self.assertTrue(DataManager.verify_checksum(path, _THEME_DATA_SHA))
+
+    def test_mismatch_fails(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'pack.7z')
+            with open(path, 'wb') as f:
+                f.write(b'theme data')
+            self.assertFalse(DataManager.verify_checksum(path, '0' * 64))
+
+    def test_missing_file_fails(self):
+        self.assertFalse(DataManager.verify_checksum('/no/such/file', '0' * 64))
+
+
 class TestExtract7z(unittest.TestCase):
     """Test extract_7z with 7z CLI."""
 
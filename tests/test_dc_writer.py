@@ -7,6 +7,8 @@ import struct
 import tempfile
 import unittest
 
+from PIL import Image
+
 from trcc.core.models import CarouselConfig, DisplayElement, ThemeConfig
 from trcc.dc_parser import parse_dc_file
 from trcc.dc_writer import (
@@ -16,6 +18,7 @@ from trcc.dc_writer import (
     export_theme,
     import_theme,
     overlay_config_to_theme,
+    parse_tr_config,
     read_carousel_config,
     save_theme,
     write_carousel_config,
@@ -24,30 +27,93 @@ from trcc.dc_writer import (
     write_tr_export,
 )
 
+_ORIG_IMAGE_SAVE = Image.Image.save
+
+
+def setUpModule():
+    """Store PNGs uncompressed for the whole module.
+
+    These tests only check that files exist / parse; zlib level 0 skips
+    the deflate pass that dominates Pillow's PNG save.
+    """
+    def _fast_save(self, fp, format=None, **kwargs):
+        kwargs.setdefault('compress_level', 0)
+        return _ORIG_IMAGE_SAVE(self, fp, format, **kwargs)
+
+    Image.Image.save = _fast_save
+
+
+def tearDownModule():
+    Image.Image.save = _ORIG_IMAGE_SAVE
+
+
+class _ByteSink:
+    """Minimal .write() sink over a bytearray — no BytesIO dispatch.
+
+    The read side pairs with BinaryReader over plain bytes (offset
+    cursor, no stream seek), so neither direction touches BytesIO.
+    """
+
+    __slots__ = ('data',)
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, b):
+        self.data.extend(b)
+
+
+# Shared read-only image fixtures — export/save only read them, and 8x8
+# keeps the PNG encode trivial. The background can be 1-byte-per-pixel
+# grayscale (nothing asserts pixel content); the mask stays RGBA since
+# the mask path is alpha-aware.
+_BG_IMG = Image.new('L', (8, 8), 0)
+_MASK_IMG = Image.new('RGBA', (8, 8), (255, 0, 0, 128))
+
 
 class TestWriteString(unittest.TestCase):
-    """Test _write_string helper."""
+    """Test _write_string helper (one reused buffer, table-driven lengths)."""
 
-    def _write_and_read(self, s):
-        import io
-        buf = io.BytesIO()
-        _write_string(buf, s)
-        return buf.getvalue()
+    def setUp(self):
+        self.buf = _ByteSink()
+
+    def _encode(self, s):
+        del self.buf.data[:]
+        _write_string(self.buf, s)
+        return bytes(self.buf.data)
 
     def test_empty_string(self):
-        data = self._write_and_read('')
-        self.assertEqual(data, b'\x00')
+        # Both sides of the boundary artifact, no stream round-trip
+        self.assertEqual(self._encode(''), b'\x00')
+        from trcc.binary_reader import BinaryReader
+        self.assertEqual(BinaryReader(b'\x00').read_string(), '')
 
     def test_short_string(self):
-        data = self._write_and_read('ABC')
-        self.assertEqual(data[0], 3)  # length
-        self.assertEqual(data[1:], b'ABC')
+        # One whole-encoding equality: length prefix + payload
+        self.assertEqual(self._encode('ABC'), b'\x03ABC')
 
     def test_utf8_string(self):
-        data = self._write_and_read('微软雅黑')
-        encoded = '微软雅黑'.encode('utf-8')
-        self.assertEqual(data[0], len(encoded))
-        self.assertEqual(data[1:], encoded)
+        payload = '微软雅黑'.encode('utf-8')
+        # Length prefix counts UTF-8 bytes (12), not characters (4)
+        self.assertEqual(len(payload), 12)
+        self.assertEqual(self._encode('微软雅黑'), b'\x0c' + payload)
+
+    def test_length_prefix_boundaries(self):
+        """7-bit length encoding at and around the 1/2-byte boundary."""
+        for n in (1, 127, 128, 200, 16383):
+            with self.subTest(n=n):
+                data = self._encode('A' * n)
+                if n < 128:
+                    self.assertEqual(data[0], n)
+                    body = data[1:]
+                else:
+                    self.assertEqual(data[0], (n & 0x7F) | 0x80)
+                    self.assertEqual(data[1], n >> 7)
+                    body = data[2:]
+                # Length + edges; full equality on a 16KB body would just
+                # build a giant diff on failure without testing more.
+                self.assertEqual(len(body), n)
+                self.assertEqual(body[:4] + body[-4:], b'A' * min(8, 2 * n))
 
 
 class TestHexToArgb(unittest.TestCase):
@@ -206,45 +272,48 @@ class TestRoundTrip(unittest.TestCase):
             os.unlink(path)
 
 
+# Overlay element template; tests derive variants via _mk_overlay(...)
+_OVERLAY_TEMPLATE = {
+    'x': 0, 'y': 0, 'color': '#FFFFFF', 'enabled': True,
+}
+
+
+def _mk_overlay(**overrides):
+    """Build an overlay element dict from the shared template."""
+    return {**_OVERLAY_TEMPLATE, **overrides}
+
+
 class TestOverlayConfigToTheme(unittest.TestCase):
     """Test overlay_config_to_theme conversion."""
 
     def test_time_element(self):
-        config = {'time_0': {
-            'x': 10, 'y': 20, 'metric': 'time',
-            'color': '#FF6B35', 'font': {'size': 24, 'style': 'bold'},
-            'enabled': True,
-        }}
+        config = {'time_0': _mk_overlay(
+            x=10, y=20, metric='time', color='#FF6B35',
+            font={'size': 24, 'style': 'bold'},
+        )}
         theme = overlay_config_to_theme(config)
         self.assertEqual(len(theme.elements), 1)
         self.assertEqual(theme.elements[0].mode, 1)
         self.assertEqual(theme.elements[0].x, 10)
 
     def test_hardware_element(self):
-        config = {'cpu': {
-            'x': 50, 'y': 100, 'metric': 'cpu_temp',
-            'color': '#FFFFFF', 'font': {'size': 16},
-            'enabled': True,
-        }}
+        config = {'cpu': _mk_overlay(
+            x=50, y=100, metric='cpu_temp', font={'size': 16},
+        )}
         theme = overlay_config_to_theme(config)
         self.assertEqual(theme.elements[0].mode, 0)
         self.assertEqual(theme.elements[0].main_count, 0)
         self.assertEqual(theme.elements[0].sub_count, 1)
 
     def test_text_element(self):
-        config = {'label': {
-            'x': 0, 'y': 0, 'text': 'Hello',
-            'color': '#00FF00', 'enabled': True,
-        }}
+        config = {'label': _mk_overlay(text='Hello', color='#00FF00')}
         theme = overlay_config_to_theme(config)
         self.assertEqual(theme.elements[0].mode, 4)
         self.assertEqual(theme.elements[0].text, 'Hello')
 
     def test_disabled_element_skipped(self):
-        config = {'item': {
-            'x': 0, 'y': 0, 'metric': 'time',
-            'color': '#FFF', 'enabled': False,
-        }}
+        config = {'item': _mk_overlay(metric='time', color='#FFF',
+                                      enabled=False)}
         theme = overlay_config_to_theme(config)
         self.assertEqual(len(theme.elements), 0)
 
@@ -304,54 +373,75 @@ class TestCarouselConfig(unittest.TestCase):
 
 
 class TestTrExportImport(unittest.TestCase):
-    """Test .tr export and import round-trip."""
-
-    def test_export_import_roundtrip(self):
-        """Export a theme, import it, verify config1.dc matches."""
-        with tempfile.TemporaryDirectory() as src, \
-             tempfile.TemporaryDirectory() as dst:
-
-            # Create source theme with background
-            from PIL import Image
-            bg = Image.new('RGB', (320, 320), (0, 100, 200))
-            bg.save(os.path.join(src, '00.png'))
-
-            # Write config1.dc
-            config = ThemeConfig(
-                elements=[
-                    DisplayElement(mode=1, mode_sub=0, x=50, y=50,
-                                  main_count=0, sub_count=0,
-                                  font_name='Arial', font_size=24.0,
-                                  color_argb=(255, 255, 255, 255)),
-                ],
-                rotation=90, mask_enabled=False,
-            )
-            write_dc_file(config, os.path.join(src, 'config1.dc'))
-
-            # Export
-            tr_path = os.path.join(dst, 'test.tr')
-            write_tr_export(config, src, tr_path)
-            self.assertTrue(os.path.exists(tr_path))
-
-            # Verify magic header
-            with open(tr_path, 'rb') as f:
-                magic = f.read(4)
-            self.assertEqual(magic, b'\xDD\xDC\xDD\xDC')
-
-            # Import
-            import_dir = os.path.join(dst, 'imported')
-            import_theme(tr_path, import_dir)
+    """Test .tr export and import round-trip.
+
+    The canonical theme is exported and imported once in setUpClass;
+    the test methods are assertion-only readers of that artifact.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        src = f'{cls.tmpdir}/src'  # POSIX paths: mkdtemp is absolute
+        os.mkdir(src)
+
+        # Create source theme with background
+        bg = _BG_IMG
+        bg.save(f'{src}/00.png')
+
+        # Write config1.dc
+        config = ThemeConfig(
+            elements=[
+                DisplayElement(mode=1, mode_sub=0, x=50, y=50,
+                              main_count=0, sub_count=0,
+                              font_name='Arial', font_size=24.0,
+                              color_argb=(255, 255, 255, 255)),
+            ],
+            rotation=90, mask_enabled=False,
+        )
+        write_dc_file(config, f'{src}/config1.dc')
+
+        # Export once, import once
+        cls.tr_path = f'{cls.tmpdir}/test.tr'
+        write_tr_export(config, src, cls.tr_path)
+        cls.import_dir = f'{cls.tmpdir}/imported'
+        import_theme(cls.tr_path, cls.import_dir)
+
+        # Template bytes for corruption tests: patch in memory instead of
+        # re-running the writer pipeline per negative case.
+        with open(cls.tr_path, 'rb') as f:
+            cls.valid_bytes = f.read()
+
+    @classmethod
+    def tearDownClass(cls):
+        import shutil
+        shutil.rmtree(cls.tmpdir)
+
+    def test_export_creates_file(self):
+        self.assertTrue(os.path.exists(self.tr_path))
+
+    def test_header_magic(self):
+        with open(self.tr_path, 'rb') as f:
+            magic = f.read(4)
+        self.assertEqual(magic, b'\xDD\xDC\xDD\xDC')
+
+    def test_imported_files_exist(self):
+        self.assertTrue(os.path.exists(os.path.join(self.import_dir, '00.png')))
+        self.assertTrue(os.path.exists(os.path.join(self.import_dir, 'config1.dc')))
+
+    def test_parse_tr_config_fast_path(self):
+        """Scalar fields readable without extracting images or dirs."""
+        theme = parse_tr_config(self.tr_path)
+        self.assertEqual(theme.rotation, 90)
+        self.assertEqual(len(theme.elements), 1)
+        self.assertEqual(theme.elements[0].x, 50)
 
-            # Verify imported files
-            self.assertTrue(os.path.exists(os.path.join(import_dir, '00.png')))
-            self.assertTrue(os.path.exists(os.path.join(import_dir, 'config1.dc')))
-
-            # Verify imported config matches
-            parsed = parse_dc_file(os.path.join(import_dir, 'config1.dc'))
-            elems = parsed.get('display_elements', [])
-            self.assertEqual(len(elems), 1)
-            self.assertEqual(elems[0].mode, 1)
-            self.assertEqual(elems[0].x, 50)
+    def test_imported_config_matches(self):
+        parsed = parse_dc_file(os.path.join(self.import_dir, 'config1.dc'))
+        elems = parsed.get('display_elements', [])
+        self.assertEqual(len(elems), 1)
+        self.assertEqual(elems[0].mode, 1)
+        self.assertEqual(elems[0].x, 50)
 
     def test_import_invalid_magic(self):
         with tempfile.NamedTemporaryFile(suffix='.tr', delete=False) as f:
@@ -363,33 +453,55 @@ class TestTrExportImport(unittest.TestCase):
         finally:
             os.unlink(path)
 
+    def test_import_corrupted_magic_byte(self):
+        """A single flipped magic byte in an otherwise valid .tr is rejected."""
+        corrupted = bytearray(self.valid_bytes)
+        corrupted[0] = 0xAA
+        path = f'{self.tmpdir}/corrupt.tr'
+        with open(path, 'wb') as f:
+            f.write(corrupted)
+        with self.assertRaises(ValueError):
+            import_theme(path, f'{self.tmpdir}/corrupt_import')
+
 
 # ── save_theme ───────────────────────────────────────────────────────────────
 
 class TestSaveTheme(unittest.TestCase):
-    """Test save_theme() full theme directory creation."""
+    """Test save_theme() full theme directory creation.
+
+    One class-scoped scratch dir (cleaned once) with a per-test subdir:
+    no mkdtemp/rmtree churn per test.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        import shutil
+        shutil.rmtree(cls.tmpdir)
+
+    def _theme_dir(self, name):
+        return f"{self.tmpdir}/{self.id().rsplit('.', 1)[-1]}/{name}"
 
     def test_save_with_background(self):
-        from PIL import Image
-        bg = Image.new('RGB', (320, 320), (255, 0, 0))
-        with tempfile.TemporaryDirectory() as tmpdir:
-            theme_dir = os.path.join(tmpdir, 'MyTheme')
-            save_theme(theme_dir, background_image=bg)
-            self.assertTrue(os.path.exists(os.path.join(theme_dir, '00.png')))
-            self.assertTrue(os.path.exists(os.path.join(theme_dir, 'Theme.png')))
-            self.assertTrue(os.path.exists(os.path.join(theme_dir, 'config1.dc')))
+        bg = _BG_IMG
+        theme_dir = self._theme_dir('MyTheme')
+        save_theme(theme_dir, background_image=bg)
+        self.assertTrue(os.path.exists(os.path.join(theme_dir, '00.png')))
+        self.assertTrue(os.path.exists(os.path.join(theme_dir, 'Theme.png')))
+        self.assertTrue(os.path.exists(os.path.join(theme_dir, 'config1.dc')))
 
     def test_save_with_mask(self):
-        from PIL import Image
-        mask = Image.new('RGBA', (200, 200), (0, 255, 0, 128))
-        with tempfile.TemporaryDirectory() as tmpdir:
-            theme_dir = os.path.join(tmpdir, 'MaskTheme')
-            save_theme(theme_dir, mask_image=mask, mask_position=(50, 50))
-            self.assertTrue(os.path.exists(os.path.join(theme_dir, '01.png')))
-            # Verify config has mask enabled
-            parsed = parse_dc_file(os.path.join(theme_dir, 'config1.dc'))
-            mask_settings = parsed.get('mask_settings', {})
-            self.assertTrue(mask_settings.get('mask_enabled', False))
+        mask = _MASK_IMG
+        theme_dir = self._theme_dir('MaskTheme')
+        save_theme(theme_dir, mask_image=mask, mask_position=(50, 50))
+        self.assertTrue(os.path.exists(os.path.join(theme_dir, '01.png')))
+        # Verify config has mask enabled
+        parsed = parse_dc_file(os.path.join(theme_dir, 'config1.dc'))
+        mask_settings = parsed.get('mask_settings', {})
+        self.assertTrue(mask_settings.get('mask_enabled', False))
 
     def test_save_with_overlay_config(self):
         overlay = {
@@ -400,29 +512,26 @@ class TestSaveTheme(unittest.TestCase):
                 'format': 'CPU: {value}°C',
             }
         }
-        with tempfile.TemporaryDirectory() as tmpdir:
-            theme_dir = os.path.join(tmpdir, 'OverlayTheme')
-            save_theme(theme_dir, overlay_config=overlay)
-            self.assertTrue(os.path.exists(os.path.join(theme_dir, 'config1.dc')))
-            parsed = parse_dc_file(os.path.join(theme_dir, 'config1.dc'))
-            self.assertGreater(len(parsed.get('display_elements', [])), 0)
+        theme_dir = self._theme_dir('OverlayTheme')
+        save_theme(theme_dir, overlay_config=overlay)
+        self.assertTrue(os.path.exists(os.path.join(theme_dir, 'config1.dc')))
+        parsed = parse_dc_file(os.path.join(theme_dir, 'config1.dc'))
+        self.assertGreater(len(parsed.get('display_elements', [])), 0)
 
     def test_save_minimal(self):
         """Save theme with no images or config → creates empty config."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            theme_dir = os.path.join(tmpdir, 'EmptyTheme')
-            save_theme(theme_dir)
-            self.assertTrue(os.path.exists(os.path.join(theme_dir, 'config1.dc')))
+        theme_dir = self._theme_dir('EmptyTheme')
+        save_theme(theme_dir)
+        self.assertTrue(os.path.exists(os.path.join(theme_dir, 'config1.dc')))
 
     def test_save_thumbnail_size(self):
         from PIL import Image
-        bg = Image.new('RGB', (480, 480), (0, 0, 255))
-        with tempfile.TemporaryDirectory() as tmpdir:
-            theme_dir = os.path.join(tmpdir, 'ThumbTheme')
-            save_theme(theme_dir, background_image=bg)
-            thumb = Image.open(os.path.join(theme_dir, 'Theme.png'))
-            self.assertLessEqual(thumb.width, 120)
-            self.assertLessEqual(thumb.height, 120)
+        bg = Image.new('RGB', (128, 128), (0, 0, 255))
+        theme_dir = self._theme_dir('ThumbTheme')
+        save_theme(theme_dir, background_image=bg)
+        thumb = Image.open(os.path.join(theme_dir, 'Theme.png'))
+        self.assertLessEqual(thumb.width, 120)
+        self.assertLessEqual(thumb.height, 120)
 
 
 # ── export_theme wrapper ─────────────────────────────────────────────────────
@@ -431,11 +540,10 @@ class TestExportTheme(unittest.TestCase):
     """Test export_theme() high-level wrapper."""
 
     def test_export_with_config(self):
-        from PIL import Image
         with tempfile.TemporaryDirectory() as src, \
              tempfile.TemporaryDirectory() as dst:
             # Create source theme
-            bg = Image.new('RGB', (320, 320), (0, 100, 200))
+            bg = _BG_IMG
             bg.save(os.path.join(src, '00.png'))
             config = ThemeConfig(
                 elements=[
@@ -462,10 +570,9 @@ class TestExportTheme(unittest.TestCase):
 
     def test_export_no_config(self):
         """Export theme dir with no config1.dc → minimal .tr created."""
-        from PIL import Image
         with tempfile.TemporaryDirectory() as src, \
              tempfile.TemporaryDirectory() as dst:
-            bg = Image.new('RGB', (320, 320), (50, 50, 50))
+            bg = _BG_IMG
             bg.save(os.path.join(src, '00.png'))
 
             tr_path = os.path.join(dst, 'noconfig.tr')
@@ -478,12 +585,11 @@ class TestExportTheme(unittest.TestCase):
             self.assertTrue(os.path.exists(os.path.join(import_dir, 'config1.dc')))
 
     def test_export_preserves_mask(self):
-        from PIL import Image
         with tempfile.TemporaryDirectory() as src, \
              tempfile.TemporaryDirectory() as dst:
-            bg = Image.new('RGB', (320, 320), (0, 0, 0))
+            bg = _BG_IMG
             bg.save(os.path.join(src, '00.png'))
-            mask = Image.new('RGBA', (100, 100), (255, 0, 0, 128))
+            mask = _MASK_IMG
             mask.save(os.path.join(src, '01.png'))
 
             config = ThemeConfig(mask_enabled=True, mask_x=50, mask_y=60)
@@ -566,21 +672,6 @@ class TestTrVideoRoundtrip(unittest.TestCase):
 
 # ── Targeted coverage: edge paths ────────────────────────────────────────────
 
-class TestWriteStringMultiByte(unittest.TestCase):
-    """Cover multi-byte length encoding for strings ≥128 chars (lines 270-271)."""
-
-    def test_long_string(self):
-        import io
-        buf = io.BytesIO()
-        long_name = 'A' * 200
-        _write_string(buf, long_name)
-        data = buf.getvalue()
-        # First byte: (200 & 0x7F) | 0x80 = 0xC8, second: 200 >> 7 = 1
-        self.assertEqual(data[0], (200 & 0x7F) | 0x80)
-        self.assertEqual(data[1], 200 >> 7)
-        self.assertIn(long_name.encode('utf-8'), data)
-
-
 class TestOverlayConfigToThemeMetrics(unittest.TestCase):
     """Cover weekday/date/cpu/gpu/text metric branches (lines 321-330)."""
 
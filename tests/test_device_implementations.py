@@ -1,146 +1,134 @@
 """Tests for LCDDeviceConfig (core/models.py) and related service methods."""
 
-import struct
 import unittest
 from unittest.mock import patch
 
+import pytest
+
 from trcc.core.models import IMPL_NAMES, LCDDeviceConfig
 from trcc.services.image import ImageService
 
 
-class TestRGBToBytes(unittest.TestCase):
+class TestRGBToBytes:
     """RGB565 big-endian conversion via ImageService."""
 
     def test_white(self):
-        result = ImageService.rgb_to_bytes(255, 255, 255, '>')
-        self.assertEqual(result, struct.pack('>H', 0xFFFF))
+        assert ImageService.rgb_to_bytes(255, 255, 255, '>') == (0xFFFF).to_bytes(2, 'big')
 
     def test_black(self):
-        result = ImageService.rgb_to_bytes(0, 0, 0, '>')
-        self.assertEqual(result, struct.pack('>H', 0x0000))
+        assert ImageService.rgb_to_bytes(0, 0, 0, '>') == (0x0000).to_bytes(2, 'big')
 
     def test_pure_red(self):
-        result = ImageService.rgb_to_bytes(255, 0, 0, '>')
-        self.assertEqual(result, struct.pack('>H', 0xF800))
+        assert ImageService.rgb_to_bytes(255, 0, 0, '>') == (0xF800).to_bytes(2, 'big')
 
     def test_pure_green(self):
-        result = ImageService.rgb_to_bytes(0, 255, 0, '>')
-        self.assertEqual(result, struct.pack('>H', 0x07E0))
+        assert ImageService.rgb_to_bytes(0, 255, 0, '>') == (0x07E0).to_bytes(2, 'big')
 
     def test_pure_blue(self):
-        result = ImageService.rgb_to_bytes(0, 0, 255, '>')
-        self.assertEqual(result, struct.pack('>H', 0x001F))
+        assert ImageService.rgb_to_bytes(0, 0, 255, '>') == (0x001F).to_bytes(2, 'big')
 
     def test_output_is_two_bytes(self):
-        result = ImageService.rgb_to_bytes(128, 64, 32, '>')
-        self.assertEqual(len(result), 2)
+        assert len(ImageService.rgb_to_bytes(128, 64, 32, '>')) == 2
 
 
-class TestResolution(unittest.TestCase):
+class TestResolution:
     """Resolution defaults and manual setting on LCDDeviceConfig."""
 
     def test_default_320x320(self):
-        cfg = LCDDeviceConfig()
-        self.assertEqual(cfg.resolution, (320, 320))
+        assert LCDDeviceConfig().resolution == (320, 320)
 
     def test_set_resolution(self):
         cfg = LCDDeviceConfig()
         cfg.width = 480
         cfg.height = 480
         cfg.resolution_detected = True
-        self.assertEqual(cfg.resolution, (480, 480))
-        self.assertTrue(cfg.resolution_detected)
+        assert cfg.resolution == (480, 480)
+        assert cfg.resolution_detected
 
     def test_resolution_not_detected_by_default(self):
-        cfg = LCDDeviceConfig()
-        self.assertFalse(cfg.resolution_detected)
+        assert not LCDDeviceConfig().resolution_detected
 
 
-class TestCommands(unittest.TestCase):
-    """Default command tuples on LCDDeviceConfig."""
+@pytest.fixture
+def cfg():
+    return LCDDeviceConfig()
+
 
-    def setUp(self):
-        self.cfg = LCDDeviceConfig()
+class TestCommands:
+    """Default command tuples on LCDDeviceConfig."""
 
-    def test_poll_command(self):
-        cmd, size = self.cfg.poll_command
-        self.assertEqual(cmd, 0xF5)
-        self.assertEqual(size, 0xE100)
+    def test_poll_command(self, cfg):
+        assert cfg.poll_command == (0xF5, 0xE100)
 
-    def test_init_command(self):
-        cmd, size = self.cfg.init_command
-        self.assertEqual(cmd, 0x1F5)
-        self.assertEqual(size, 0xE100)
+    def test_init_command(self, cfg):
+        assert cfg.init_command == (0x1F5, 0xE100)
 
-    def test_frame_chunks_count(self):
+    def test_frame_chunks_count(self, cfg):
         from trcc.device_scsi import ScsiDevice
-        chunks = ScsiDevice._get_frame_chunks(self.cfg.width, self.cfg.height)
-        self.assertEqual(len(chunks), 4)
+        chunks = ScsiDevice._get_frame_chunks(cfg.width, cfg.height)
+        assert len(chunks) == 4
 
     def test_frame_chunks_total_size(self):
         """Total frame data = sum of chunk sizes."""
         from trcc.device_scsi import ScsiDevice
         total = sum(size for _, size in ScsiDevice._get_frame_chunks(320, 320))
         # 3 * 0x10000 + 0x2000 = 196608 + 8192 = 204800 = 320*320*2
-        self.assertEqual(total, 320 * 320 * 2)
+        assert total == 320 * 320 * 2
 
-    def test_no_init_per_frame(self):
-        self.assertFalse(self.cfg.init_per_frame)
+    def test_no_init_per_frame(self, cfg):
+        assert not cfg.init_per_frame
 
-    def test_zero_delays(self):
-        self.assertEqual(self.cfg.init_delay, 0.0)
-        self.assertEqual(self.cfg.frame_delay, 0.0)
+    def test_zero_delays(self, cfg):
+        assert cfg.init_delay == 0.0
+        assert cfg.frame_delay == 0.0
 
 
-class TestRegistry(unittest.TestCase):
+class TestRegistry:
     """LCDDeviceConfig.from_key() and IMPL_NAMES registry."""
 
     def test_get_thermalright(self):
         cfg = LCDDeviceConfig.from_key('thermalright_lcd_v1')
-        self.assertIsInstance(cfg, LCDDeviceConfig)
-        self.assertIn('Thermalright', cfg.name)
+        assert isinstance(cfg, LCDDeviceConfig)
+        assert 'Thermalright' in cfg.name
 
     def test_get_ali_corp(self):
         cfg = LCDDeviceConfig.from_key('ali_corp_lcd_v1')
-        self.assertIsInstance(cfg, LCDDeviceConfig)
-        self.assertIn('ALi Corp', cfg.name)
+        assert isinstance(cfg, LCDDeviceConfig)
+        assert 'ALi Corp' in cfg.name
 
     def test_get_generic(self):
         cfg = LCDDeviceConfig.from_key('generic')
-        self.assertIsInstance(cfg, LCDDeviceConfig)
-        self.assertEqual(cfg.name, 'Generic LCD')
+        assert isinstance(cfg, LCDDeviceConfig)
+        assert cfg.name == 'Generic LCD'
 
     def test_unknown_falls_back_to_generic(self):
-        cfg = LCDDeviceConfig.from_key('nonexistent_device')
-        self.assertEqual(cfg.name, 'Generic LCD')
+        assert LCDDeviceConfig.from_key('nonexistent_device').name == 'Generic LCD'
 
     def test_all_implementations_are_lcd_config(self):
-        for name in IMPL_NAMES:
-            cfg = LCDDeviceConfig.from_key(name)
-            self.assertIsInstance(cfg, LCDDeviceConfig)
+        assert all(isinstance(LCDDeviceConfig.from_key(name), LCDDeviceConfig)
+                   for name in IMPL_NAMES)
 
     def test_list_all(self):
         result = LCDDeviceConfig.list_all()
-        self.assertEqual(len(result), len(IMPL_NAMES))
-        names = {item['name'] for item in result}
-        self.assertEqual(names, set(IMPL_NAMES.keys()))
+        assert len(result) == len(IMPL_NAMES)
+        assert {item['name'] for item in result} == set(IMPL_NAMES.keys())
 
 
-class TestConcreteDevices(unittest.TestCase):
+class TestConcreteDevices:
     """Concrete device names."""
 
     def test_thermalright_name(self):
-        self.assertIn('Thermalright', LCDDeviceConfig.from_key('thermalright_lcd_v1').name)
+        assert 'Thermalright' in LCDDeviceConfig.from_key('thermalright_lcd_v1').name
 
     def test_ali_corp_name(self):
-        self.assertIn('ALi Corp', LCDDeviceConfig.from_key('ali_corp_lcd_v1').name)
+        assert 'ALi Corp' in LCDDeviceConfig.from_key('ali_corp_lcd_v1').name
 
     def test_generic_name(self):
-        self.assertEqual(LCDDeviceConfig.from_key('generic').name, 'Generic LCD')
+        assert LCDDeviceConfig.from_key('generic').name == 'Generic LCD'
 
     def test_pixel_format(self):
-        for key in IMPL_NAMES:
-            self.assertEqual(LCDDeviceConfig.from_key(key).pixel_format, 'RGB565')
+        assert {LCDDeviceConfig.from_key(key).pixel_format
+                for key in IMPL_NAMES} == {'RGB565'}
 
 
 class TestDetectResolution(unittest.TestCase):
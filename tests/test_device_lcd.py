@@ -2,26 +2,55 @@
 
 import binascii
 import struct
-import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from trcc.core.models import LCDDeviceConfig
 from trcc.device_lcd import LCDDriver
 
 
 def _mock_device(vid=0x3633, pid=0x0002, scsi='/dev/sg0',
                  vendor='Thermalright', product='LCD', impl='generic'):
-    """Build a mock DetectedDevice."""
-    dev = MagicMock()
-    dev.vid = vid
-    dev.pid = pid
-    dev.scsi_device = scsi
-    dev.vendor_name = vendor
-    dev.product_name = product
-    dev.usb_path = '1-2'
-    dev.implementation = impl
-    return dev
+    """Build a stub DetectedDevice (the real dataclass — no MagicMock)."""
+    from trcc.device_detector import DetectedDevice
+    return DetectedDevice(
+        vid=vid, pid=pid, vendor_name=vendor, product_name=product,
+        usb_path='1-2', scsi_device=scsi, implementation=impl,
+    )
+
+
+@pytest.fixture
+def mock_device():
+    """Fresh DetectedDevice stub per test (one flat-record alloc; mutate freely)."""
+    return _mock_device()
+
+
+def _bare_driver(implementation=..., initialized=False):
+    """Build an LCDDriver without running __init__ (no detection)."""
+    driver = LCDDriver.__new__(LCDDriver)
+    driver.device_info = _mock_device()
+    driver.device_path = '/dev/sg0'
+    driver.implementation = (LCDDeviceConfig() if implementation is ...
+                             else implementation)
+    driver.initialized = initialized
+    return driver
+
+
+@pytest.fixture
+def bare_driver():
+    """Pre-populated, already-initialized driver."""
+    return _bare_driver(initialized=True)
+
+
+@pytest.fixture(scope='session')
+def tiny_rgb_png(tmp_path_factory):
+    """One small red PNG shared by every test that loads an image."""
+    from PIL import Image
+    path = tmp_path_factory.mktemp('img') / 't.png'
+    Image.new('RGB', (10, 10), (255, 0, 0)).save(path)
+    return str(path)
 
 
 # ── Header building + CRC ───────────────────────────────────────────────────
@@ -56,128 +85,120 @@ class TestLCDDriverHeaderCRC(unittest.TestCase):
 
 # ── Init paths ───────────────────────────────────────────────────────────────
 
-class TestLCDDriverInit(unittest.TestCase):
+class TestLCDDriverInit:
 
-    @patch('trcc.device_lcd.DeviceService.detect_lcd_resolution', return_value=False)
-    @patch('trcc.device_lcd.detect_devices')
-    def test_init_with_path_finds_device(self, mock_detect, _):
-        dev = _mock_device(scsi='/dev/sg1')
-        mock_detect.return_value = [dev]
+    @pytest.fixture(autouse=True)
+    def _no_resolution_probe(self, monkeypatch):
+        """Skip the FBL resolution probe for every init test."""
+        monkeypatch.setattr(
+            'trcc.device_lcd.DeviceService.detect_lcd_resolution',
+            lambda *args, **kwargs: False)
+
+    def test_init_with_path_finds_device(self, monkeypatch, mock_device):
+        mock_device.scsi_device = '/dev/sg1'
+        monkeypatch.setattr('trcc.device_lcd.detect_devices',
+                            lambda: [mock_device])
 
         driver = LCDDriver(device_path='/dev/sg1')
-        self.assertEqual(driver.device_path, '/dev/sg1')
-        self.assertEqual(driver.device_info, dev)
-        self.assertIsInstance(driver.implementation, LCDDeviceConfig)
+        assert driver.device_path == '/dev/sg1'
+        assert driver.device_info == mock_device
+        assert isinstance(driver.implementation, LCDDeviceConfig)
+
+    def test_init_with_path_falls_back_to_generic(self, monkeypatch):
+        monkeypatch.setattr('trcc.device_lcd.detect_devices', lambda: [])
 
-    @patch('trcc.device_lcd.DeviceService.detect_lcd_resolution', return_value=False)
-    @patch('trcc.device_lcd.detect_devices', return_value=[])
-    def test_init_with_path_falls_back_to_generic(self, mock_detect, _):
         driver = LCDDriver(device_path='/dev/sg5')
-        self.assertEqual(driver.device_path, '/dev/sg5')
-        self.assertIsNone(driver.device_info)
-        self.assertEqual(driver.implementation.name, 'Generic LCD')
+        assert driver.device_path == '/dev/sg5'
+        assert driver.device_info is None
+        assert driver.implementation.name == 'Generic LCD'
 
-    @patch('trcc.device_lcd.DeviceService.detect_lcd_resolution', return_value=False)
-    @patch('trcc.device_lcd.detect_devices')
-    def test_init_by_vid_pid(self, mock_detect, _):
-        dev = _mock_device(vid=0x3633, pid=0x0002, scsi='/dev/sg0')
-        mock_detect.return_value = [dev]
+    def test_init_by_vid_pid(self, monkeypatch, mock_device):
+        monkeypatch.setattr('trcc.device_lcd.detect_devices',
+                            lambda: [mock_device])
 
         driver = LCDDriver(vid=0x3633, pid=0x0002)
-        self.assertEqual(driver.device_path, '/dev/sg0')
+        assert driver.device_path == '/dev/sg0'
 
-    @patch('trcc.device_lcd.DeviceService.detect_lcd_resolution', return_value=False)
-    @patch('trcc.device_lcd.detect_devices', return_value=[])
-    def test_init_by_vid_pid_not_found_raises(self, mock_detect, _):
-        with self.assertRaises(RuntimeError):
+    def test_init_by_vid_pid_not_found_raises(self, monkeypatch):
+        monkeypatch.setattr('trcc.device_lcd.detect_devices', lambda: [])
+
+        with pytest.raises(RuntimeError):
             LCDDriver(vid=0xDEAD, pid=0xBEEF)
 
-    @patch('trcc.device_lcd.DeviceService.detect_lcd_resolution', return_value=False)
-    @patch('trcc.device_lcd.get_default_device')
-    def test_init_auto_detect(self, mock_default, _):
-        dev = _mock_device()
-        mock_default.return_value = dev
+    def test_init_auto_detect(self, monkeypatch, mock_device):
+        monkeypatch.setattr('trcc.device_lcd.get_default_device',
+                            lambda: mock_device)
 
         driver = LCDDriver()
-        self.assertEqual(driver.device_info, dev)
+        assert driver.device_info == mock_device
+
+    def test_init_auto_detect_no_device(self, monkeypatch):
+        monkeypatch.setattr('trcc.device_lcd.get_default_device', lambda: None)
 
-    @patch('trcc.device_lcd.get_default_device', return_value=None)
-    def test_init_auto_detect_no_device(self, _):
-        with self.assertRaises(RuntimeError):
+        with pytest.raises(RuntimeError):
             LCDDriver()
 
 
 # ── Frame operations ─────────────────────────────────────────────────────────
 
-class TestLCDDriverFrameOps(unittest.TestCase):
-
-    def _make_driver(self):
-        driver = LCDDriver.__new__(LCDDriver)
-        driver.device_info = _mock_device()
-        driver.device_path = '/dev/sg0'
-        driver.implementation = LCDDeviceConfig()
-        driver.initialized = True
-        return driver
+class TestLCDDriverFrameOps:
 
-    @patch('trcc.device_lcd.ImageService.rgb_to_bytes', return_value=b'\xFF\x00')
-    def test_create_solid_color(self, _):
-        driver = self._make_driver()
-        data = driver.create_solid_color(255, 0, 0)
+    @patch('trcc.services.image.ImageService.rgb_to_bytes', return_value=b'\xFF\x00')
+    def test_create_solid_color(self, _, bare_driver):
+        data = bare_driver.create_solid_color(255, 0, 0)
         # 320*320 pixels * 2 bytes each
-        self.assertEqual(len(data), 320 * 320 * 2)
-        self.assertEqual(data[:2], b'\xFF\x00')
+        assert len(data) == 320 * 320 * 2
+        assert data[:2] == b'\xFF\x00'
 
     def test_create_solid_color_no_impl_raises(self):
-        driver = LCDDriver.__new__(LCDDriver)
-        driver.implementation = None
-        with self.assertRaises(RuntimeError):
+        driver = _bare_driver(implementation=None)
+        with pytest.raises(RuntimeError):
             driver.create_solid_color(0, 0, 0)
 
     @patch('trcc.device_scsi.ScsiDevice._scsi_write', return_value=True)
     @patch('trcc.device_scsi.ScsiDevice._get_frame_chunks', return_value=[(0x10, 100)])
-    def test_send_frame_pads_short_data(self, mock_chunks, mock_write):
-        driver = self._make_driver()
-        driver.send_frame(b'\x00' * 50)
+    def test_send_frame_pads_short_data(self, mock_chunks, mock_write, bare_driver):
+        bare_driver.send_frame(b'\x00' * 50)
         # Should pad to 100 bytes — _scsi_write(dev, header, data)
         args = mock_write.call_args
         sent_data = args[0][2]  # 3rd positional arg is data
-        self.assertEqual(len(sent_data), 100)
+        assert len(sent_data) == 100
 
     def test_send_frame_no_impl_raises(self):
-        driver = LCDDriver.__new__(LCDDriver)
-        driver.implementation = None
-        driver.initialized = False
-        with self.assertRaises(RuntimeError):
+        driver = _bare_driver(implementation=None)
+        with pytest.raises(RuntimeError):
             driver.send_frame(b'\x00')
 
+    @patch('trcc.device_scsi.ScsiDevice._scsi_write', return_value=True)
+    def test_send_frame_reuses_chunk_plan(self, mock_write, bare_driver):
+        """Chunk headers are built once per resolution and reused."""
+        bare_driver.send_frame(b'\x00' * (320 * 320 * 2))
+        plan = bare_driver._chunk_plan
+        assert plan is not None
+        assert len(plan) == 4  # 320x320 = 3x64K + 8K
+        bare_driver.send_frame(b'\x00' * (320 * 320 * 2))
+        assert bare_driver._chunk_plan is plan
 
-# ── get_info ─────────────────────────────────────────────────────────────────
 
-class TestLCDDriverGetInfo(unittest.TestCase):
+# ── get_info ─────────────────────────────────────────────────────────────────
 
-    def test_info_full(self):
-        driver = LCDDriver.__new__(LCDDriver)
-        driver.device_path = '/dev/sg0'
-        driver.initialized = True
-        driver.device_info = _mock_device()
-        driver.implementation = LCDDeviceConfig()
+class TestLCDDriverGetInfo:
 
-        info = driver.get_info()
-        self.assertEqual(info['device_path'], '/dev/sg0')
-        self.assertTrue(info['initialized'])
-        self.assertIn('vendor', info)
-        self.assertIn('resolution', info)
+    def test_info_full(self, bare_driver):
+        info = bare_driver.get_info()
+        assert info['device_path'] == '/dev/sg0'
+        assert info['initialized']
+        assert 'vendor' in info
+        assert 'resolution' in info
 
     def test_info_minimal(self):
-        driver = LCDDriver.__new__(LCDDriver)
+        driver = _bare_driver(implementation=None)
         driver.device_path = None
-        driver.initialized = False
         driver.device_info = None
-        driver.implementation = None
 
         info = driver.get_info()
-        self.assertIsNone(info['device_path'])
-        self.assertNotIn('vendor', info)
+        assert info['device_path'] is None
+        assert 'vendor' not in info
 
 
 # ── SCSI read/write ──────────────────────────────────────────────────────────
@@ -223,69 +244,38 @@ class TestLCDDriverScsiIO(unittest.TestCase):
 
 # ── init_device ──────────────────────────────────────────────────────────────
 
-class TestLCDDriverInitDevice(unittest.TestCase):
-
-    def _make_driver(self):
-        driver = LCDDriver.__new__(LCDDriver)
-        driver.device_info = _mock_device()
-        driver.device_path = '/dev/sg0'
-        driver.implementation = LCDDeviceConfig()
-        driver.initialized = False
-        return driver
+class TestLCDDriverInitDevice:
 
     @patch('trcc.device_scsi.ScsiDevice._scsi_write', return_value=True)
     @patch('trcc.device_scsi.ScsiDevice._scsi_read', return_value=b'')
     def test_init_device_calls_poll_then_init(self, mock_read, mock_write):
-        driver = self._make_driver()
+        driver = _bare_driver()
         driver.init_device()
         mock_read.assert_called_once()
         mock_write.assert_called_once()
-        self.assertTrue(driver.initialized)
+        assert driver.initialized
 
     @patch('trcc.device_scsi.ScsiDevice._scsi_write', return_value=True)
     @patch('trcc.device_scsi.ScsiDevice._scsi_read', return_value=b'')
-    def test_init_device_skips_if_already_initialized(self, mock_read, mock_write):
-        driver = self._make_driver()
-        driver.initialized = True
-        driver.init_device()
+    def test_init_device_skips_if_already_initialized(self, mock_read, mock_write, bare_driver):
+        bare_driver.init_device()
         mock_read.assert_not_called()
         mock_write.assert_not_called()
 
 
 # ── load_image ───────────────────────────────────────────────────────────────
 
-class TestLCDDriverLoadImage(unittest.TestCase):
-
-    def _make_driver(self):
-        driver = LCDDriver.__new__(LCDDriver)
-        driver.device_info = _mock_device()
-        driver.device_path = '/dev/sg0'
-        driver.implementation = LCDDeviceConfig()
-        driver.initialized = False
-        return driver
-
-    def test_load_image_converts_to_rgb565(self):
-        driver = self._make_driver()
-
-        # Create a small test image
-        from PIL import Image
-        img = Image.new('RGB', (10, 10), (255, 0, 0))
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as f:
-            img.save(f, 'PNG')
-            tmp_path = f.name
-
-        try:
-            data = driver.load_image(tmp_path)
-            # 320x320 resolution * 2 bytes per pixel
-            self.assertEqual(len(data), 320 * 320 * 2)
-        finally:
-            import os
-            os.unlink(tmp_path)
+class TestLCDDriverLoadImage:
+
+    def test_load_image_converts_to_rgb565(self, tiny_rgb_png):
+        driver = _bare_driver()
+        data = driver.load_image(tiny_rgb_png)
+        # 320x320 resolution * 2 bytes per pixel
+        assert len(data) == 320 * 320 * 2
 
     def test_load_image_no_impl_raises(self):
-        driver = LCDDriver.__new__(LCDDriver)
-        driver.implementation = None
-        with self.assertRaises(RuntimeError):
+        driver = _bare_driver(implementation=None)
+        with pytest.raises(RuntimeError):
             driver.load_image('/tmp/test.png')
 
 
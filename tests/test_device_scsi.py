@@ -129,6 +129,11 @@ class TestGetFrameChunks(unittest.TestCase):
             expected = _FRAME_CMD_BASE | (i << 24)
             self.assertEqual(cmd, expected, f"Chunk {i}: {cmd:#x} != {expected:#x}")
 
+    def test_cached_per_resolution(self):
+        """Repeated calls share one immutable tuple (lru_cache hit)."""
+        self.assertIs(ScsiDevice._get_frame_chunks(320, 320),
+                      ScsiDevice._get_frame_chunks(320, 320))
+
     def test_last_chunk_may_be_smaller(self):
         chunks = ScsiDevice._get_frame_chunks(320, 320)
         last_size = chunks[-1][1]
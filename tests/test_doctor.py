@@ -5,6 +5,8 @@ from __future__ import annotations
 import unittest
 from unittest.mock import patch
 
+import pytest
+
 from trcc.doctor import (
     _check_binary,
     _check_library,
@@ -36,83 +38,46 @@ class TestReadOsRelease(unittest.TestCase):
         self.assertEqual(result, {})
 
 
-class TestDetectPkgManager(unittest.TestCase):
+class TestDetectPkgManager:
     """Test distro → package manager mapping."""
 
-    @patch('trcc.doctor._read_os_release',
-           return_value={'ID': 'fedora', 'ID_LIKE': ''})
-    def test_fedora(self, _):
-        self.assertEqual(_detect_pkg_manager(), 'dnf')
-
-    @patch('trcc.doctor._read_os_release',
-           return_value={'ID': 'ubuntu', 'ID_LIKE': 'debian'})
-    def test_ubuntu(self, _):
-        self.assertEqual(_detect_pkg_manager(), 'apt')
-
-    @patch('trcc.doctor._read_os_release',
-           return_value={'ID': 'arch', 'ID_LIKE': ''})
-    def test_arch(self, _):
-        self.assertEqual(_detect_pkg_manager(), 'pacman')
-
-    @patch('trcc.doctor._read_os_release',
-           return_value={'ID': 'pop', 'ID_LIKE': 'ubuntu debian'})
-    def test_pop_os(self, _):
-        self.assertEqual(_detect_pkg_manager(), 'apt')
-
-    @patch('trcc.doctor._read_os_release',
-           return_value={'ID': 'nobara', 'ID_LIKE': 'fedora'})
-    def test_nobara(self, _):
-        self.assertEqual(_detect_pkg_manager(), 'dnf')
-
-    @patch('trcc.doctor._read_os_release',
-           return_value={'ID': 'cachyos', 'ID_LIKE': 'arch'})
-    def test_cachyos_id_like_fallback(self, _):
-        self.assertEqual(_detect_pkg_manager(), 'pacman')
-
-    @patch('trcc.doctor._read_os_release',
-           return_value={'ID': 'unknowndistro', 'ID_LIKE': ''})
-    def test_unknown_returns_none(self, _):
-        self.assertIsNone(_detect_pkg_manager())
-
-    @patch('trcc.doctor._read_os_release',
-           return_value={'ID': 'zorin', 'ID_LIKE': 'ubuntu debian'})
-    def test_zorin(self, _):
-        self.assertEqual(_detect_pkg_manager(), 'apt')
-
-    @patch('trcc.doctor._read_os_release',
-           return_value={'ID': 'void', 'ID_LIKE': ''})
-    def test_void(self, _):
-        self.assertEqual(_detect_pkg_manager(), 'xbps')
-
-    @patch('trcc.doctor._read_os_release',
-           return_value={'ID': 'opensuse-tumbleweed', 'ID_LIKE': 'suse'})
-    def test_opensuse(self, _):
-        self.assertEqual(_detect_pkg_manager(), 'zypper')
+    @pytest.mark.parametrize('os_id, id_like, expected', [
+        ('fedora', '', 'dnf'),
+        ('ubuntu', 'debian', 'apt'),
+        ('arch', '', 'pacman'),
+        ('pop', 'ubuntu debian', 'apt'),
+        ('nobara', 'fedora', 'dnf'),
+        ('cachyos', 'arch', 'pacman'),  # ID_LIKE fallback
+        ('zorin', 'ubuntu debian', 'apt'),
+        ('void', '', 'xbps'),
+        ('opensuse-tumbleweed', 'suse', 'zypper'),
+        ('unknowndistro', '', None),
+    ])
+    def test_detect(self, monkeypatch, os_id, id_like, expected):
+        monkeypatch.setattr('trcc.doctor._read_os_release',
+                            lambda: {'ID': os_id, 'ID_LIKE': id_like})
+        _detect_pkg_manager.cache_clear()
+        assert _detect_pkg_manager() == expected
 
 
 # ── Install hints ────────────────────────────────────────────────────────────
 
 
-class TestInstallHint(unittest.TestCase):
+class TestInstallHint:
     """Test distro-specific install command generation."""
 
-    def test_fedora_sg_raw(self):
-        hint = _install_hint('sg_raw', 'dnf')
-        self.assertIn('dnf install', hint)
-        self.assertIn('sg3_utils', hint)
-
-    def test_apt_7z(self):
-        hint = _install_hint('7z', 'apt')
-        self.assertIn('apt install', hint)
-        self.assertIn('p7zip-full', hint)
-
-    def test_unknown_pm_shows_all(self):
-        hint = _install_hint('sg_raw', None)
-        self.assertIn('install one of:', hint)
+    @pytest.mark.parametrize('dep, pm, expected_parts', [
+        ('sg_raw', 'dnf', ['dnf install', 'sg3_utils']),
+        ('7z', 'apt', ['apt install', 'p7zip-full']),
+        ('sg_raw', None, ['install one of:']),  # unknown pm shows all
+    ])
+    def test_hint(self, dep, pm, expected_parts):
+        hint = _install_hint(dep, pm)
+        for part in expected_parts:
+            assert part in hint
 
     def test_unknown_dep(self):
-        hint = _install_hint('nonexistent', 'dnf')
-        self.assertEqual(hint, 'install nonexistent')
+        assert _install_hint('nonexistent', 'dnf') == 'install nonexistent'
 
 
 # ── Check helpers ────────────────────────────────────────────────────────────
@@ -142,17 +107,17 @@ class TestCheckPythonModule(unittest.TestCase):
 class TestCheckBinary(unittest.TestCase):
     """Test binary availability checking."""
 
-    @patch('shutil.which', return_value='/usr/bin/7z')
+    @patch('trcc.doctor._which', return_value='/usr/bin/7z')
     def test_found(self, _):
         result = _check_binary('7z', required=True, pm='dnf')
         self.assertTrue(result)
 
-    @patch('shutil.which', return_value=None)
+    @patch('trcc.doctor._which', return_value=None)
     def test_missing_required(self, _):
         result = _check_binary('7z', required=True, pm='dnf')
         self.assertFalse(result)
 
-    @patch('shutil.which', return_value=None)
+    @patch('trcc.doctor._which', return_value=None)
     def test_missing_optional(self, _):
         result = _check_binary('ffmpeg', required=False, pm='apt')
         self.assertTrue(result)
@@ -216,13 +181,18 @@ class TestRunDoctor(unittest.TestCase):
 # ── CLI dispatch ─────────────────────────────────────────────────────────────
 
 
-class TestDoctorCLI(unittest.TestCase):
+def _run_cli(monkeypatch, *args):
+    """Invoke trcc's CLI main() with the given argv (reverted on teardown)."""
+    monkeypatch.setattr('sys.argv', ['trcc', *args])
+    from trcc.cli import main
+    return main()
+
+
+class TestDoctorCLI:
     """Test doctor command dispatch from CLI."""
 
-    @patch('trcc.doctor.run_doctor', return_value=0)
-    @patch('sys.argv', ['trcc', 'doctor'])
-    def test_dispatch(self, mock_doctor):
-        from trcc.cli import main
-        result = main()
-        self.assertEqual(result, 0)
+    def test_dispatch(self, monkeypatch):
+        with patch('trcc.doctor.run_doctor', return_value=0) as mock_doctor:
+            result = _run_cli(monkeypatch, 'doctor')
+        assert result == 0
         mock_doctor.assert_called_once()
@@ -17,28 +17,28 @@ from trcc.media_player import (
 
 
 def _make_theme_zt(frames=4, size=(8, 8), quality=50):
-    """Create a minimal Theme.zt binary file. Returns path."""
+    """Create a minimal Theme.zt binary file. Returns path.
+
+    JPEGs are saved straight into the output file (size prefix
+    backpatched) — no per-frame BytesIO round-trip.
+    """
     fd, path = tempfile.mkstemp(suffix='.zt')
     os.close(fd)
 
-    jpeg_blobs = []
-    for i in range(frames):
-        img = Image.new('RGB', size, color=(0, i * 60, 0))
-        buf = io.BytesIO()
-        img.save(buf, format='JPEG', quality=quality)
-        jpeg_blobs.append(buf.getvalue())
-
-    # Timestamps: 0, 42, 84, ...
-    timestamps = [i * 42 for i in range(frames)]
-
     with open(path, 'wb') as f:
-        f.write(struct.pack('B', 0xDC))           # magic
+        f.write(struct.pack('B', 0xDC))             # magic
         f.write(struct.pack('<i', frames))          # frame_count
-        for ts in timestamps:
-            f.write(struct.pack('<i', ts))          # timestamps
-        for blob in jpeg_blobs:
-            f.write(struct.pack('<i', len(blob)))   # size
-            f.write(blob)                           # JPEG data
+        for i in range(frames):
+            f.write(struct.pack('<i', i * 42))      # timestamps: 0, 42, 84...
+        for i in range(frames):
+            start = f.tell()
+            f.write(struct.pack('<i', 0))           # size placeholder
+            img = Image.new('RGB', size, color=(0, i * 60, 0))
+            img.save(f, format='JPEG', quality=quality)
+            end = f.tell()
+            f.seek(start)
+            f.write(struct.pack('<i', end - start - 4))  # backpatch size
+            f.seek(end)
 
     return path
 
@@ -84,6 +84,32 @@ class TestVideoDecoderProperties(unittest.TestCase):
         d = _make_video_decoder(frame_count=5)
         self.assertEqual(d.frame_count, 5)
 
+    def test_lazy_mode_decodes_on_demand(self):
+        """lazy=True keeps blobs compressed and decodes per frame_at()."""
+        path = _make_theme_zt(frames=3)
+        try:
+            decoder = ThemeZtDecoder(path, lazy=True)
+            self.assertEqual(decoder.frames, [])  # nothing pre-decoded
+            self.assertEqual(decoder.frame_count, 3)
+            frame = decoder.frame_at(1)
+            self.assertEqual(frame.mode, 'RGB')
+            self.assertIs(decoder.frame_at(1), frame)  # LRU-cached
+            self.assertIsNone(decoder.frame_at(99))
+            decoder.close()
+        finally:
+            os.unlink(path)
+
+    def test_frame_at_eager_mode(self):
+        """frame_at() also works for eagerly decoded frames."""
+        path = _make_theme_zt(frames=2)
+        try:
+            decoder = ThemeZtDecoder(path)
+            self.assertIs(decoder.frame_at(0), decoder.frames[0])
+            self.assertIsNone(decoder.frame_at(5))
+            decoder.close()
+        finally:
+            os.unlink(path)
+
     def test_close_clears_frames(self):
         d = _make_video_decoder()
         self.assertTrue(len(d.frames) > 0)
@@ -108,16 +134,25 @@ class TestVideoDecoderInit(unittest.TestCase):
 class TestVideoDecoderDecode(unittest.TestCase):
     """Cover VideoDecoder.__init__ -> _decode with mocked subprocess."""
 
+    @staticmethod
+    def _mock_proc(stdout=b'', stderr=b'', returncode=0):
+        """Popen stand-in streaming stdout/stderr from BytesIO."""
+        proc = MagicMock()
+        proc.stdout = io.BytesIO(stdout)
+        proc.stderr = io.BytesIO(stderr)
+        proc.wait.return_value = returncode
+        return proc
+
     @patch('trcc.media_player.FFMPEG_AVAILABLE', True)
-    @patch('subprocess.run')
-    def test_decode_success(self, mock_run):
-        """FFmpeg pipe returns raw RGB frames -> frames loaded."""
+    @patch('subprocess.Popen')
+    def test_decode_success(self, mock_popen):
+        """FFmpeg pipe streams raw RGB frames -> frames loaded."""
         w, h = 8, 8
         frame_size = w * h * 3
         # 3 frames of raw RGB data
         raw_data = bytes(range(256))[:frame_size] * 3
 
-        mock_run.return_value = MagicMock(returncode=0, stdout=raw_data)
+        mock_popen.return_value = self._mock_proc(stdout=raw_data)
 
         decoder = VideoDecoder('/fake/video.mp4', target_size=(w, h))
         self.assertEqual(decoder.frame_count, 3)
@@ -127,48 +162,68 @@ class TestVideoDecoderDecode(unittest.TestCase):
         decoder.close()
 
     @patch('trcc.media_player.FFMPEG_AVAILABLE', True)
-    @patch('subprocess.run')
-    def test_decode_partial_frame_ignored(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_decode_partial_frame_ignored(self, mock_popen):
         """Incomplete trailing frame data is dropped."""
         w, h = 4, 4
         frame_size = w * h * 3
         # 1 full frame + partial
         raw_data = b'\x00' * frame_size + b'\xFF' * 10
 
-        mock_run.return_value = MagicMock(returncode=0, stdout=raw_data)
+        mock_popen.return_value = self._mock_proc(stdout=raw_data)
 
         decoder = VideoDecoder('/fake/vid.mp4', target_size=(w, h))
         self.assertEqual(decoder.frame_count, 1)
         decoder.close()
 
     @patch('trcc.media_player.FFMPEG_AVAILABLE', True)
-    @patch('subprocess.run')
-    def test_decode_ffmpeg_failure(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_decode_ffmpeg_failure(self, mock_popen):
         """FFmpeg returns non-zero -> RuntimeError."""
-        mock_run.return_value = MagicMock(returncode=1, stderr=b'error msg', stdout=b'')
+        mock_popen.return_value = self._mock_proc(
+            stderr=b'error msg', returncode=1)
         with self.assertRaises(RuntimeError):
             VideoDecoder('/fake/vid.mp4')
 
     @patch('trcc.media_player.FFMPEG_AVAILABLE', True)
-    @patch('subprocess.run')
-    def test_decode_ffmpeg_timeout(self, mock_run):
-        """FFmpeg times out -> propagates TimeoutExpired."""
+    @patch('trcc.media_player._DECODE_TIMEOUT', 0.05)
+    @patch('subprocess.Popen')
+    def test_decode_ffmpeg_timeout(self, mock_popen):
+        """A hung ffmpeg (stdout never delivers) -> killed + TimeoutExpired."""
         import subprocess as sp
-        mock_run.side_effect = sp.TimeoutExpired('ffmpeg', 300)
+        import threading
+
+        class _HungStream:
+            """Blocks reads until released (simulates a stalled pipe)."""
+
+            def __init__(self):
+                self._released = threading.Event()
+
+            def read(self, n=-1):
+                self._released.wait()
+                return b''
+
+            def close(self):
+                self._released.set()
+
+        proc = self._mock_proc()
+        proc.stdout = _HungStream()
+        proc.stderr = _HungStream()
+        mock_popen.return_value = proc
         with self.assertRaises(sp.TimeoutExpired):
             VideoDecoder('/fake/vid.mp4')
+        proc.kill.assert_called_once()
 
     @patch('trcc.media_player.FFMPEG_AVAILABLE', True)
-    @patch('subprocess.run')
-    def test_decode_empty_output(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_decode_empty_output(self, mock_popen):
         """FFmpeg returns success but no output -> 0 frames."""
-        mock_run.return_value = MagicMock(returncode=0, stdout=b'')
+        mock_popen.return_value = self._mock_proc()
         decoder = VideoDecoder('/fake/vid.mp4', target_size=(8, 8))
         self.assertEqual(decoder.frame_count, 0)
         self.assertEqual(len(decoder.frames), 0)
         decoder.close()
 
-
 # -- VideoDecoder.extract_frames --------------------------------------------
 
 class TestExtractFrames(unittest.TestCase):
@@ -239,12 +294,17 @@ class TestExtractFrames(unittest.TestCase):
 
 class TestCheckFfmpeg(unittest.TestCase):
 
-    @patch('subprocess.run')
-    def test_ffmpeg_available(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0)
+    def setUp(self):
+        _check_ffmpeg.cache_clear()
+
+    def tearDown(self):
+        _check_ffmpeg.cache_clear()
+
+    @patch('trcc.media_player.shutil.which', return_value='/usr/bin/ffmpeg')
+    def test_ffmpeg_available(self, _):
         self.assertTrue(_check_ffmpeg())
 
-    @patch('subprocess.run', side_effect=FileNotFoundError)
+    @patch('trcc.media_player.shutil.which', return_value=None)
     def test_ffmpeg_not_found(self, _):
         self.assertFalse(_check_ffmpeg())
 
@@ -1,5 +1,6 @@
 """Tests for core/models.py – ThemeInfo, DeviceInfo, VideoState data classes."""
 
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -26,11 +27,13 @@ class TestThemeInfoFromDirectory(unittest.TestCase):
         shutil.rmtree(self.tmpdir)
 
     def _make_theme(self, name, files=('00.png',)):
-        d = Path(self.tmpdir) / name
-        d.mkdir()
+        # os-level calls: this helper runs dozens of times per test run
+        d = os.path.join(self.tmpdir, name)
+        os.mkdir(d)
         for f in files:
-            (d / f).write_bytes(b'\x89PNG')
-        return d
+            with open(os.path.join(d, f), 'wb') as fh:
+                fh.write(b'\x89PNG')
+        return Path(d)
 
     def test_basic_theme(self):
         d = self._make_theme('001a', ['00.png'])
@@ -537,6 +537,12 @@ from trcc.qt_components.qt_app_mvc import LOCALE_TO_LANG, detect_language  # noq
 class TestDetectLanguage(unittest.TestCase):
     """Test language detection from locale."""
 
+    def setUp(self):
+        detect_language.cache_clear()
+
+    def tearDown(self):
+        detect_language.cache_clear()
+
     def test_returns_string(self):
         lang = detect_language()
         self.assertIsInstance(lang, str)
@@ -11,12 +11,12 @@ Tests cover:
 """
 
 import io
-import tempfile
 import unittest
 from contextlib import redirect_stdout
-from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from trcc.theme_downloader import (
     _SHORT_ALIASES,
     THEME_REGISTRY,
@@ -25,6 +25,7 @@ from trcc.theme_downloader import (
     _resolve_pack_name,
     download_pack,
     list_available,
+    parse_resolution,
     remove_pack,
     show_info,
 )
@@ -44,10 +45,11 @@ class TestThemeRegistry(unittest.TestCase):
                 self.assertIsInstance(info, PackInfo)
 
     def test_resolution_format(self):
-        """Resolution must be WxH format (e.g., '320x320')."""
+        """Resolution must be WxH format (single-sourced via parse_resolution)."""
         for pack_id, info in THEME_REGISTRY.items():
             with self.subTest(pack=pack_id):
-                self.assertRegex(info.resolution, r'^\d+x\d+$')
+                self.assertEqual(parse_resolution(info.resolution),
+                                 (info.width, info.height))
 
     def test_pack_id_matches_resolution(self):
         """Pack ID format is themes-{w}x{h}."""
@@ -242,90 +244,76 @@ class TestRemovePack(unittest.TestCase):
         with patch('trcc.theme_downloader.USER_DATA_DIR', '/nonexistent'):
             self.assertEqual(remove_pack('themes-320x320'), 1)
 
-    def test_removes_installed(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            theme_dir = Path(tmp) / 'theme320320'
-            theme_dir.mkdir()
-            (theme_dir / 'Theme1').mkdir()
-
-            with patch('trcc.theme_downloader.USER_DATA_DIR', tmp):
-                result = remove_pack('themes-320x320')
 
-            self.assertEqual(result, 0)
-            self.assertFalse(theme_dir.exists())
+class TestRemovePackInstalled:
+    """remove_pack against an installed pack (tmp_path-backed)."""
 
-    def test_remove_with_alias(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            theme_dir = Path(tmp) / 'theme320320'
-            theme_dir.mkdir()
-            (theme_dir / 'Theme1').mkdir()
+    @pytest.mark.parametrize('pack', ['themes-320x320', 'themes-320'])
+    def test_removes_installed(self, tmp_path, pack):
+        theme_dir = tmp_path / 'theme320320'
+        theme_dir.mkdir()
+        (theme_dir / 'Theme1').mkdir()
 
-            with patch('trcc.theme_downloader.USER_DATA_DIR', tmp):
-                result = remove_pack('themes-320')
+        with patch('trcc.theme_downloader.USER_DATA_DIR', str(tmp_path)):
+            result = remove_pack(pack)
 
-            self.assertEqual(result, 0)
-            self.assertFalse(theme_dir.exists())
+        assert result == 0
+        assert not theme_dir.exists()
 
 
 # ── _theme_dir / _is_installed / _theme_count ────────────────────────────
 
 
-class TestHelpers(unittest.TestCase):
-
-    def test_theme_dir_prefers_user(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            user_dir = Path(tmp) / 'user' / 'theme320320'
-            user_dir.mkdir(parents=True)
-            pkg_dir = Path(tmp) / 'pkg' / 'theme320320'
-            pkg_dir.mkdir(parents=True)
-
-            with patch('trcc.theme_downloader.USER_DATA_DIR', str(Path(tmp) / 'user')), \
-                 patch('trcc.theme_downloader.DATA_DIR', str(Path(tmp) / 'pkg')):
-                result = ThemeDownloader._theme_dir(320, 320)
-            self.assertEqual(result, user_dir)
-
-    def test_theme_dir_falls_back_to_pkg(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            pkg_dir = Path(tmp) / 'pkg' / 'theme320320'
-            pkg_dir.mkdir(parents=True)
-
-            with patch('trcc.theme_downloader.USER_DATA_DIR', str(Path(tmp) / 'user')), \
-                 patch('trcc.theme_downloader.DATA_DIR', str(Path(tmp) / 'pkg')):
-                result = ThemeDownloader._theme_dir(320, 320)
-            self.assertEqual(result, pkg_dir)
-
-    def test_is_installed_false_when_empty(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            d = Path(tmp) / 'theme320320'
-            d.mkdir()
-            with patch('trcc.theme_downloader.USER_DATA_DIR', tmp), \
-                 patch('trcc.theme_downloader.DATA_DIR', '/nonexistent'):
-                self.assertFalse(ThemeDownloader._is_installed(320, 320))
-
-    def test_is_installed_true_with_content(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            d = Path(tmp) / 'theme320320'
-            d.mkdir()
-            (d / 'Theme1').mkdir()
-            with patch('trcc.theme_downloader.USER_DATA_DIR', tmp), \
-                 patch('trcc.theme_downloader.DATA_DIR', '/nonexistent'):
-                self.assertTrue(ThemeDownloader._is_installed(320, 320))
-
-    def test_theme_count(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            d = Path(tmp) / 'theme320320'
-            d.mkdir()
-            (d / 'Theme1').mkdir()
-            (d / 'Theme2').mkdir()
-            (d / 'readme.txt').write_text('hi')  # file, not dir
-            with patch('trcc.theme_downloader.USER_DATA_DIR', tmp), \
-                 patch('trcc.theme_downloader.DATA_DIR', '/nonexistent'):
-                self.assertEqual(ThemeDownloader._theme_count(320, 320), 2)
+class TestHelpers:
+
+    def test_theme_dir_prefers_user(self, tmp_path):
+        user_dir = tmp_path / 'user' / 'theme320320'
+        user_dir.mkdir(parents=True)
+        pkg_dir = tmp_path / 'pkg' / 'theme320320'
+        pkg_dir.mkdir(parents=True)
+
+        with patch('trcc.theme_downloader.USER_DATA_DIR', str(tmp_path / 'user')), \
+             patch('trcc.theme_downloader.DATA_DIR', str(tmp_path / 'pkg')):
+            result = ThemeDownloader._theme_dir(320, 320)
+        assert result == user_dir
+
+    def test_theme_dir_falls_back_to_pkg(self, tmp_path):
+        pkg_dir = tmp_path / 'pkg' / 'theme320320'
+        pkg_dir.mkdir(parents=True)
+
+        with patch('trcc.theme_downloader.USER_DATA_DIR', str(tmp_path / 'user')), \
+             patch('trcc.theme_downloader.DATA_DIR', str(tmp_path / 'pkg')):
+            result = ThemeDownloader._theme_dir(320, 320)
+        assert result == pkg_dir
+
+    def test_is_installed_false_when_empty(self, tmp_path):
+        (tmp_path / 'theme320320').mkdir()
+        with patch('trcc.theme_downloader.USER_DATA_DIR', str(tmp_path)), \
+             patch('trcc.theme_downloader.DATA_DIR', '/nonexistent'):
+            assert not ThemeDownloader._is_installed(320, 320)
+
+    def test_is_installed_true_with_content(self, tmp_path):
+        d = tmp_path / 'theme320320'
+        d.mkdir()
+        (d / 'Theme1').mkdir()
+        with patch('trcc.theme_downloader.USER_DATA_DIR', str(tmp_path)), \
+             patch('trcc.theme_downloader.DATA_DIR', '/nonexistent'):
+            assert ThemeDownloader._is_installed(320, 320)
+
+    def test_theme_count(self, tmp_path):
+        d = tmp_path / 'theme320320'
+        d.mkdir()
+        (d / 'Theme1').mkdir()
+        (d / 'Theme2').mkdir()
+        (d / 'readme.txt').write_text('hi')  # file, not dir
+        with patch('trcc.theme_downloader.USER_DATA_DIR', str(tmp_path)), \
+             patch('trcc.theme_downloader.DATA_DIR', '/nonexistent'):
+            assert ThemeDownloader._theme_count(320, 320) == 2
 
     def test_theme_count_nonexistent(self):
         with patch('trcc.theme_downloader.USER_DATA_DIR', '/nonexistent'), \
              patch('trcc.theme_downloader.DATA_DIR', '/nonexistent'):
-            self.assertEqual(ThemeDownloader._theme_count(999, 999), 0)
+            assert ThemeDownloader._theme_count(999, 999) == 0
 
 
 if __name__ == '__main__':